@@ -17,8 +17,10 @@ class Looper:
     Attributes
     ----------
     __gen_num (int): The quantity of synthetic images needed to be generated.
-    __gen_num_counter (int): The quantity of synthetic images that have already been generated.
-    __remain_gen_num (int): The quantity of synthetic images remaining to be generated.
+    __gen_num_counter (int): The quantity of scenes already processed, generated or failed, the next scene index.
+    __gen_fail_counter (int): The quantity of scenes skipped because their generation failed.
+    __strict (bool): Stop the loop on the first failed scene instead of skipping it, defaults to the HUMANSDG_STRICT environment variable.
+    __remain_gen_num (int): The quantity of scenes remaining to be processed.
     __start_time (float): The starting time of synthetic image generation.
     __end_time (float): The ending time of synthetic image generation.
     __time_seque (deque of float): A seque to temporarily store time consumed for generating 20 synthetic images.
@@ -42,9 +44,11 @@ class Looper:
 
     """
 
-    def __init__(self, gen_num =  5000):
+    def __init__(self, gen_num =  5000, strict = None):
         self.__gen_num = gen_num
         self.__gen_num_counter = 0
+        self.__gen_fail_counter = 0
+        self.__strict = os.environ.get("HUMANSDG_STRICT", "0") == "1" if strict is None else strict
         self.__remain_gen_num = 0
         self.__start_time = 0
         self.__end_time = 0
@@ -91,7 +95,7 @@ class Looper:
         """ 
         """
         # Passing  gen_num param
-        parameter = PeopleSansPeopleParameter()
+        parameter = HumanSDGParameter()
         self.__gen_num = parameter.gen_num
 
         while self.__gen_num_counter < self.__gen_num:
@@ -107,16 +111,27 @@ class Looper:
             data_generator_path = os.path.join(module_path,"HumanSDG_400_DataGenerator.py")
 
             # Set args
+            scene_index = self.__gen_num_counter
             args = [
                 blender_exe_path,
                 "--python",
-                data_generator_path
+                data_generator_path,
+                "--",
+                "--scene-index",
+                str(scene_index)
                 ]
 
             # Create new process
-            subprocess.run(args)
+            completed_process = subprocess.run(args)
 
             self.__gen_num_counter += 1
+
+            # Log and skip failed scene, or stop in strict mode
+            if completed_process.returncode != 0:
+                self.__gen_fail_counter += 1
+                print(f"Scene {scene_index} failed with return code {completed_process.returncode}, skipped {self.__gen_fail_counter} scenes so far")
+                if self.__strict:
+                    raise RuntimeError(f"Scene {scene_index} generation failed in strict mode")
             
             # Log end time
             self.__end_time = time.time()
@@ -125,10 +140,11 @@ class Looper:
 
             print(f"Generate 1 Image ETA: {int(self.__average_time_consume_per_img)} Seconds")
             print(f"Generate 1k Images ETA: {self.__gen_1k_imgs_eta}")
-            print(f"Already Generated {self.__gen_num_counter}/{self.__gen_num} Images")
-            print(f"Remain {self.__remain_gen_num} Images Need To Generate, ETA: {self.__gen_n_imgs_eta}")
+            # Failed scenes are processed but produce no image, report them apart
+            print(f"Already Generated {self.__gen_num_counter - self.__gen_fail_counter}/{self.__gen_num} Images, {self.__gen_fail_counter} Failed")
+            print(f"Remain {self.__remain_gen_num} Scenes Need To Generate, ETA: {self.__gen_n_imgs_eta}")
 
-        print(f"Generate {self.__gen_num} Images COMPLERED !!!")
+        print(f"Generate {self.__gen_num_counter - self.__gen_fail_counter}/{self.__gen_num} Images, {self.__gen_fail_counter} Failed COMPLERED !!!")
 
 
 if __name__ == '__main__':
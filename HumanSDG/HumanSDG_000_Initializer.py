@@ -11,6 +11,7 @@ class Initializer:
     __render_engine (str): Engine to use for rendering.
     __render_device (str): Device to use for rendering.
     __collection_need_create (list of str): Scene Collection need to create.
+    __data_collection_need_remove (tuple of str): The bpy.data collections whose data blocks are removed on init.
     __camera_location (tuple of int): Initial camera location.
     camera_focal_length (int): Perspective Camera focal length value in millimeters.
     img_resolution_x (int): Number of horizontal pixels in the rendered image.
@@ -35,6 +36,9 @@ class Initializer:
         self.__render_engine = "CYCLES"
         self.__render_device = "GPU"
         self.__collection_need_create = ["BackgroundObjectCollection", "HumanCollection","OccluderCollection"]
+        self.__data_collection_need_remove = ("objects", "meshes", "materials", "textures", "images", "cameras",
+                                              "lights", "armatures", "actions", "worlds", "collections",
+                                              "node_groups", "libraries", "brushes", "particles", "scenes")
         self.__camera_location = (0, 0, 8)
         self.camera_focal_length = camera_focal_length
         self.img_resolution_x = img_resolution_x
@@ -42,19 +46,31 @@ class Initializer:
 
 
     def __remove_all_data(self):
-        """ Remove all data blocks except opened scripts and scene."""
-        # Go through all attributes of bpy.data
-        for collection in dir(bpy.data):
+        """ Remove all data blocks except opened scripts and scene.
+
+        References
+        ----------
+        https://docs.blender.org/api/current/bpy.types.BlendData.html#bpy.types.BlendData.batch_remove
+
+        """
+        # Remove all data blocks in a single call when available (Blender 2.83+)
+        if hasattr(bpy.data, "batch_remove"):
+            data_blocks = [block for collection in self.__data_collection_need_remove
+                           for block in getattr(bpy.data, collection)
+                           # Skip the default scene
+                           if not (isinstance(block, bpy.types.Scene) and block.name == "Scene")]
+            bpy.data.batch_remove(ids = data_blocks)
+            return
+
+        # Go through the data collections the pipeline creates data blocks in
+        for collection in self.__data_collection_need_remove:
             data_structure = getattr(bpy.data, collection)
-            # Check that it is a data collection
-            if isinstance(data_structure, bpy.types.bpy_prop_collection) and hasattr(data_structure, "remove") \
-                    and collection not in ["texts"]:
-                # Go over all entities in that collection
-                for block in data_structure:
-                    # Skip the default scene
-                    if isinstance(block, bpy.types.Scene) and block.name == "Scene":
-                        continue
-                    data_structure.remove(block)
+            # Go over a snapshot of all entities in that collection, as removing mutates it
+            for block in list(data_structure):
+                # Skip the default scene
+                if isinstance(block, bpy.types.Scene) and block.name == "Scene":
+                    continue
+                data_structure.remove(block)
 
 
     def __remove_custom_properties(self):
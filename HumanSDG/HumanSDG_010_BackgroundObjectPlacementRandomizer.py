@@ -2,11 +2,8 @@ import bpy
 import numpy as np
 from util import poissonDiscSampling
 import math
-import random
 from mathutils import Euler
-import os
-import glob
-import sys
+from util.cachedGlob import asset_path_list
 
 
 class BackgroundObjectPlacementRandomizer:
@@ -22,11 +19,14 @@ class BackgroundObjectPlacementRandomizer:
     ----------
     __background_plane_size (list of float): Background plane dimension(x, y).
     background_poisson_disk_sampling_radius (float): Background objects separation distance.
+    background_poisson_disk_cell_size (float): Side of the sampler background grid cell, None to let the sampler compute it.
     __background_domain_size (numpy.ndarray): Spatial distribution area of background objects.
     asset_background_object_folder_path (str): The path to background object assets.
+    asset_background_object_path_list (sequence of str): The sorted paths to the background object assets, None to list asset_background_object_folder_path.
     __background_object_collection (bpy.types.Collection): The Collection data-block of background objects.
     __n_particle (int): Number of generated particles of the poisson disks sampling.
     __particle_coordinates (numpy.ndarray): Coordinates of the poisson disks sampling.
+    __rng (numpy.random.Generator): Random generator of the poisson disk sampling and the asset selection, built from the seed argument (None, int or numpy.random.Generator).
 
     Methods
     -------
@@ -40,15 +40,21 @@ class BackgroundObjectPlacementRandomizer:
 
     def __init__(self, 
                 asset_background_object_folder_path = 'C:/Users/user/Documents/project/synthDet/Asset/background_object',
-                background_poisson_disk_sampling_radius = 0.5
+                asset_background_object_path_list = None,
+                background_poisson_disk_sampling_radius = 0.5,
+                background_poisson_disk_cell_size = None,
+                seed = None
                 ):
         self.__background_plane_size = [9, 7] # x, y 
         self.background_poisson_disk_sampling_radius = background_poisson_disk_sampling_radius
+        self.background_poisson_disk_cell_size = background_poisson_disk_cell_size
         self.__background_domain_size = np.array([float(self.__background_plane_size[0]),float(self.__background_plane_size[1])])
         self.asset_background_object_folder_path = asset_background_object_folder_path
+        self.asset_background_object_path_list = asset_background_object_path_list
         self.__background_object_collection = bpy.data.collections["BackgroundObjectCollection"]
         self.__n_particle = None
         self.__particle_coordinates = None
+        self.__rng = np.random.default_rng(seed)
 
 
     def __error_check(self,asset_path_list):
@@ -60,9 +66,7 @@ class BackgroundObjectPlacementRandomizer:
         """
         num_asset_in_folder = len(asset_path_list)
         if num_asset_in_folder < 1:
-            print(f'ERROR!!! can not find any background asset in {self.asset_background_object_folder_path}')
-            input("Press Enter to continue...")
-            sys.exit()
+            raise FileNotFoundError(f'can not find any background asset in {self.asset_background_object_folder_path}')
 
 
     def __load_object(self,filepath):
@@ -89,22 +93,23 @@ class BackgroundObjectPlacementRandomizer:
 
     def __posson_disc_sampling(self):
         """Generate the sampling with a spatially variable sampling radius."""
-        # It seem like function poisson_disc_sampling sometimes will break (mtbf:2000-3000 cycle), when it break , return a empty list[]
-        # add condition check len(self.__particle_coordinates) must >= 1
-        while self.__n_particle == None or self.__n_particle == 0:
-            self.__particle_coordinates = poissonDiscSampling.poisson_disc_sampling(radius = self.background_poisson_disk_sampling_radius,
-                                                                            sample_domain_size = self.__background_domain_size,
-                                                                            sample_rejection_threshold = 30)
-            self.__n_particle = len(self.__particle_coordinates)
-
-        loc_offset = np.array([float(self.__background_plane_size[0])/2,float(self.__background_plane_size[1])/2])
-        self.__particle_coordinates -= loc_offset
+        # Center the plane on x, y, the sampler emits world coordinates directly
+        loc_offset = np.array([-float(self.__background_plane_size[0])/2,-float(self.__background_plane_size[1])/2])
+        # Bridson sampling always keeps its initial sample, so the result is never empty
+        self.__particle_coordinates = poissonDiscSampling.poisson_disc_sampling(radius = self.background_poisson_disk_sampling_radius,
+                                                                        sample_domain_size = self.__background_domain_size,
+                                                                        sample_rejection_threshold = 30,
+                                                                        seed = int(self.__rng.integers(2**31)),
+                                                                        origin = loc_offset,
+                                                                        cell_size = self.background_poisson_disk_cell_size)
+        self.__n_particle = len(self.__particle_coordinates)
+        assert self.__n_particle >= 1, "poisson disc sampling returned no particle"
 
 
     def __import_background_object_asset(self):
         """Import a number of __n_particle background objects into current blender scene."""   
         # Get background object asset path
-        background_object_path_list = glob.glob(os.path.join(self.asset_background_object_folder_path, "*.blend"))
+        background_object_path_list = asset_path_list(self.asset_background_object_path_list, self.asset_background_object_folder_path, "*.blend")
         self.__error_check(asset_path_list = background_object_path_list)
         bg_obj_num = len(background_object_path_list)
 
@@ -122,7 +127,7 @@ class BackgroundObjectPlacementRandomizer:
                     self.__load_object(filepath = background_object_path_list[i])
         else:
             # Randomly import background object
-            random_bg_obj_list = random.sample(background_object_path_list, self.__n_particle)
+            random_bg_obj_list = self.__rng.choice(background_object_path_list, size = self.__n_particle, replace = False)
             for bg_obj_path in background_object_path_list:
                     self.__load_object(filepath = bg_obj_path)
 
@@ -1,13 +1,11 @@
 import bpy
-from bpy_extras.object_utils import world_to_camera_view
 import numpy as np
 from util import poissonDiscSampling
+from util.cameraView import points_in_camera_view
+from util.cachedGlob import asset_path_list
 import math
-import random
-from mathutils import Euler, Vector
-import os
-import glob
-import sys
+from mathutils import Euler
+from util.valueRange import Range
 
 
 class ForegroundObjectPlacementRandomizer:
@@ -25,20 +23,25 @@ class ForegroundObjectPlacementRandomizer:
     __camera (bpy.types.Camera): The blender camera data-block.
     __clip_start (float): Camera near clipping distance.
     __clip_end (float): Camera far clipping distance.
-    num_foreground_object_in_scene_range (dict of str: int): The distribution of the number of retail items within the blender scene.
+    num_foreground_object_in_scene_range (Range of int): The distribution of the number of retail items within the blender scene.
     __num_foreground_object_in_scene (int): The number of retail items within the blender scene.
     foreground_area (list of float): Spatial distribution area of foreground objects.
     __foreground_domain_size (numpy.ndarray): Spatial distribution area of foreground objects(convert foreground_area to ndarray).
     foreground_poisson_disk_sampling_radius (float): Foreground objects separation distance.
+    foreground_poisson_disk_cell_size (float): Side of the sampler background grid cell, None to let the sampler compute it.
     asset_foreground_object_folder_path (str): The path to foreground object assets.
+    asset_foreground_object_path_list (sequence of str): The sorted paths to the foreground object assets, None to list asset_foreground_object_folder_path.
     __foreground_object_collection (bpy.types.Collection): The blender collection data-block of foreground objects.
     __n_particle (int): Number of generated particles of the poisson disks sampling.
     __particle_coordinates (numpy.ndarray): Coordinates of the poisson disks sampling.
-    __particle_coordinates_can_see_in_view (list of list of float): Coordinates of the poisson disks sampling.
+    __loaded_object_dict (dict of str: list of bpy.types.Object): Objects already appended from each foreground object asset.
+    __rng (numpy.random.Generator): Random generator of the foreground object number, asset and location selection, built from the seed argument (None, int or numpy.random.Generator).
+    __armature_object_list (list of bpy.types.Object): The imported armature objects, in link order.
 
     Methods
     -------
     __error_check(): Check assigned background object assets folder path isn't empty.
+    __duplicate_object(): Duplicate already appended objects, sharing their data-blocks.
     __load_object(): Load asset from other blendfile to the current blendfile.
     __posson_disc_sampling(): Using poisson disk sampling algorithm to generate the sampling.
     __import_foreground_object_asset(): Import a number of __n_particle foreground objects into current blender scene.
@@ -48,10 +51,13 @@ class ForegroundObjectPlacementRandomizer:
     """ 
 
     def __init__(self,
-                 num_foreground_object_in_scene_range = {"min": 1 , "max": 5}, # Must <= 5
+                 num_foreground_object_in_scene_range = Range(1, 5), # Must <= 5
                  foreground_area = [9, 7, 4],
                  foreground_poisson_disk_sampling_radius = 1.5,
-                 asset_foreground_object_folder_path = "C:/Users/user/Documents/project/PeopleSansPeople/Asset/Human/Procedural"
+                 foreground_poisson_disk_cell_size = None,
+                 asset_foreground_object_folder_path = "C:/Users/user/Documents/project/PeopleSansPeople/Asset/Human/Procedural",
+                 asset_foreground_object_path_list = None,
+                 seed = None
                  ):
         self.__scene = bpy.data.scenes["Scene"]
         self.__camera = bpy.data.objects['Camera']
@@ -62,11 +68,15 @@ class ForegroundObjectPlacementRandomizer:
         self.foreground_area = foreground_area
         self.__foreground_domain_size = np.array(self.foreground_area)
         self.foreground_poisson_disk_sampling_radius = foreground_poisson_disk_sampling_radius
+        self.foreground_poisson_disk_cell_size = foreground_poisson_disk_cell_size
         self.asset_foreground_object_folder_path = asset_foreground_object_folder_path
+        self.asset_foreground_object_path_list = asset_foreground_object_path_list
         self.__foreground_object_collection = bpy.data.collections["HumanCollection"]
         self.__n_particle = None
         self.__particle_coordinates = None # np.array
-        self.__particle_coordinates_can_see_in_view = list()
+        self.__loaded_object_dict = dict() # Data format : {'asset_path': [obj1, obj2], ...}
+        self.__rng = np.random.default_rng(seed)
+        self.__armature_object_list = list()
 
 
     def __error_check(self,asset_path_list):
@@ -78,17 +88,74 @@ class ForegroundObjectPlacementRandomizer:
         """
         num_asset_in_folder = len(asset_path_list)
         if num_asset_in_folder < 1:
-            print(f'ERROR!!! can not find any foreground asset in {self.asset_foreground_object_folder_path}')
-            input("Press Enter to continue...")
-            sys.exit()
+            raise FileNotFoundError(f'can not find any foreground asset in {self.asset_foreground_object_folder_path}')
     
 
+    def __duplicate_object(self, object_list):
+        """Duplicate already appended objects, the copies share the mesh and armature data-blocks of the originals.
+
+        Args:
+            object_list (list of bpy.types.Object): Objects appended from one foreground object asset.
+
+        Return:
+            (list of bpy.types.Object): The copied objects, not linked to any collection yet.
+
+        """
+        copy_dict = {obj: obj.copy() for obj in object_list}
+        for obj_copy in copy_dict.values():
+            # Rebind every pointer to an original of the asset to its copy, so the copy follows the copied rig
+            if obj_copy.parent in copy_dict:
+                obj_copy.parent = copy_dict[obj_copy.parent]
+            for modifier in obj_copy.modifiers:
+                self.__remap_object_pointers(modifier, copy_dict)
+            constraint_list = list(obj_copy.constraints)
+            if obj_copy.pose is not None:
+                for pose_bone in obj_copy.pose.bones:
+                    constraint_list.extend(pose_bone.constraints)
+            for constraint in constraint_list:
+                self.__remap_object_pointers(constraint, copy_dict)
+                # Armature constraints keep their targets in a collection
+                for constraint_target in getattr(constraint, "targets", ()):
+                    self.__remap_object_pointers(constraint_target, copy_dict)
+            if obj_copy.animation_data is not None:
+                for fcurve in obj_copy.animation_data.drivers:
+                    for variable in fcurve.driver.variables:
+                        for driver_target in variable.targets:
+                            if driver_target.id in copy_dict:
+                                driver_target.id = copy_dict[driver_target.id]
+        return list(copy_dict.values())
+
+
+    def __remap_object_pointers(self, struct, copy_dict):
+        """Point every writable Object pointer property of struct that targets a key of copy_dict to its copy.
+
+        Args:
+            struct (bpy.types.bpy_struct): A modifier, constraint or constraint target of a copied object.
+            copy_dict (dict of bpy.types.Object: bpy.types.Object): The original objects and their copies.
+
+        References
+        ----------
+        https://docs.blender.org/api/current/bpy.types.PointerProperty.html
+
+        """
+        for prop in struct.bl_rna.properties:
+            if prop.type == "POINTER" and not prop.is_readonly and prop.fixed_type.identifier == "Object":
+                target = getattr(struct, prop.identifier)
+                if target in copy_dict:
+                    setattr(struct, prop.identifier, copy_dict[target])
+
+
     def __load_object(self,filepath):
         """Load asset from other blendfile to the current blendfile.
 
+        An asset which is already appended is duplicated instead of being read from its blendfile again.
+
         Args:
             filepath (str): The path to background object assets.
 
+        Return:
+            (list of bpy.types.Object): The loaded objects, not linked to any collection yet.
+
         References
         ----------
         https://studio.blender.org/training/scripting-for-artists/5eabe54d521eafd0953f6d45/
@@ -97,46 +164,53 @@ class ForegroundObjectPlacementRandomizer:
         https://blender.stackexchange.com/questions/34540/how-to-link-append-a-data-block-using-the-python-api?noredirect=1&lq=1
         
         """  
+        # Reuse objects already appended from this .blend file
+        if filepath in self.__loaded_object_dict:
+            return self.__duplicate_object(self.__loaded_object_dict[filepath])
+
         # Append object from .blend file
         with bpy.data.libraries.load(filepath, link = False,assets_only = True) as (data_from, data_to):
             data_to.objects = data_from.objects
-        # Link object to current scene
-        for obj in data_to.objects:
-            if obj is not None:
-                self.__foreground_object_collection.objects.link(obj)
+        loaded_object_list = [obj for obj in data_to.objects if obj is not None]
+        self.__loaded_object_dict[filepath] = loaded_object_list
+        return loaded_object_list
 
 
     def __posson_disc_sampling(self):
         """Generate the sampling with a spatially variable sampling radius."""
-        # It seem like function poisson_disc_sampling sometimes will break (mtbf:2000-3000 cycle), when it break , return a empty list[]
-        # add condition check len(self.__particle_coordinates) must >= 1
-        while self.__n_particle == None or self.__n_particle == 0:
-            self.__particle_coordinates = poissonDiscSampling.poisson_disc_sampling(radius = self.foreground_poisson_disk_sampling_radius,
-                                                                            sample_domain_size = self.__foreground_domain_size,
-                                                                            sample_rejection_threshold = 30)
-            self.__n_particle = len(self.__particle_coordinates)
-            
+        # Center the domain on x, y and lift it 2 above the ground, the sampler emits world coordinates directly
+        loc_offset = np.array([-self.__foreground_domain_size[0]/2,-self.__foreground_domain_size[1]/2,2])
+        # Bridson sampling always keeps its initial sample, so the result is never empty
+        self.__particle_coordinates = poissonDiscSampling.poisson_disc_sampling(radius = self.foreground_poisson_disk_sampling_radius,
+                                                                        sample_domain_size = self.__foreground_domain_size,
+                                                                        sample_rejection_threshold = 30,
+                                                                        seed = int(self.__rng.integers(2**31)),
+                                                                        origin = loc_offset,
+                                                                        cell_size = self.foreground_poisson_disk_cell_size)
+        self.__n_particle = len(self.__particle_coordinates)
+        assert self.__n_particle >= 1, "poisson disc sampling returned no particle"
+
         print(f"nParticle Prev : {self.__n_particle}") # Show posson disc sampling caculated particle num
-        loc_offset = np.array([self.__foreground_domain_size[0]/2,self.__foreground_domain_size[1]/2,-2])
-        self.__particle_coordinates -= loc_offset
 
 
     def __import_foreground_object_asset(self):
         """Import a number of __n_particle foreground objects into current blender scene."""    
-        # Check n_particle must bigger than num_foreground_object_in_scene
+        # Clip num_foreground_object_in_scene to n_particle, so there is a location for every foreground object
         if self.__n_particle < self.__num_foreground_object_in_scene:
-            print('Warning!!! nParticle:{} must bigger than fg_obj_in_scene_num:{}'.format(self.__n_particle,self.__num_foreground_object_in_scene))
-            input("Press Enter to continue...") 
-            sys.exit()
+            print('Warning!!! nParticle:{} smaller than fg_obj_in_scene_num:{}, clip fg_obj_in_scene_num'.format(self.__n_particle,self.__num_foreground_object_in_scene))
+            self.__num_foreground_object_in_scene = self.__n_particle
         
         # Get foreground object asset path
-        foreground_object_path_list = glob.glob(os.path.join(self.asset_foreground_object_folder_path, "*.blend"))
+        foreground_object_path_list = asset_path_list(self.asset_foreground_object_path_list, self.asset_foreground_object_folder_path, "*.blend")
         self.__error_check(asset_path_list = foreground_object_path_list)
         num_fg_obj = len(foreground_object_path_list)
         print("num fg obj in folder: {}".format(num_fg_obj))
 
         # Shuffle foreground_object_path_list
-        random.shuffle(foreground_object_path_list)
+        self.__rng.shuffle(foreground_object_path_list)
+
+        # Collect all imported objects, they are linked to the scene in a single pass below
+        loaded_object_list = []
 
         # Check num_foreground_object_in_scene is bigger than num_fg_obj
         if self.__num_foreground_object_in_scene >= num_fg_obj:
@@ -146,16 +220,24 @@ class ForegroundObjectPlacementRandomizer:
 
             for i in range(num_loop):
                 for fg_obj_path in foreground_object_path_list:
-                    self.__load_object(filepath = fg_obj_path)
+                    loaded_object_list.extend(self.__load_object(filepath = fg_obj_path))
 
             if num_remain != 0:
                 for i in range(num_remain):
-                    self.__load_object(filepath = foreground_object_path_list[i])
+                    loaded_object_list.extend(self.__load_object(filepath = foreground_object_path_list[i]))
         else:
             # Randomly select n(n=num_foreground_object_in_scene) fg_obj from foreground_object_path_list, then import to scene
-            foreground_object_path_list_selected = random.sample(foreground_object_path_list, self.__num_foreground_object_in_scene)
+            foreground_object_path_list_selected = self.__rng.choice(foreground_object_path_list, size = self.__num_foreground_object_in_scene, replace = False)
             for fg_obj_path in foreground_object_path_list_selected:
-                self.__load_object(filepath = fg_obj_path)
+                loaded_object_list.extend(self.__load_object(filepath = fg_obj_path))
+
+        # Link object to current scene, then evaluate the view layer once for all of them
+        self.__armature_object_list = list()
+        for obj in loaded_object_list:
+            self.__foreground_object_collection.objects.link(obj)
+            if obj.type == "ARMATURE": # Select armature object only
+                self.__armature_object_list.append(obj)
+        bpy.context.view_layer.update()
 
 
     def __check_particle_in_cam_view(self):
@@ -163,24 +245,19 @@ class ForegroundObjectPlacementRandomizer:
 
         References
         ----------
-        https://blender.stackexchange.com/questions/284884/what-does-world-to-camera-view-depend-on
         https://blender.stackexchange.com/questions/258000/how-to-update-world-transformation-matrices-without-calling-a-scene-update/258002#258002
 
         """
         # Update camera object matrix_world
         self.__camera.matrix_world = self.__camera.matrix_basis 
 
-        for coordinates in self.__particle_coordinates:
-            # World space to ndc space
-            vector_p = Vector(coordinates)
-            co_ndc = world_to_camera_view(self.__scene, self.__camera, vector_p)
-            # Check wether point is inside frustum
-            if (0.0 < co_ndc.x < 1.0 and 0.0 < co_ndc.y < 1.0 and self.__clip_start < co_ndc.z < self.__clip_end):
-                 self.__particle_coordinates_can_see_in_view.append(coordinates)
-                
+        # Keep only the particles inside the camera frustum
+        particle_coordinates = np.asarray(self.__particle_coordinates, dtype = np.float64)
+        in_view = points_in_camera_view(self.__scene, self.__camera, particle_coordinates, self.__clip_start, self.__clip_end)
+
         # Update __particle_coordinates and __n_particle var value
-        self.__particle_coordinates = np.array(self.__particle_coordinates_can_see_in_view)
-        self.__n_particle = len(self.__particle_coordinates_can_see_in_view)
+        self.__particle_coordinates = particle_coordinates[in_view]
+        self.__n_particle = len(self.__particle_coordinates)
 
 
     def foreground_object_placement_randomize(self):
@@ -191,7 +268,7 @@ class ForegroundObjectPlacementRandomizer:
         [1]https://stackoverflow.com/questions/14262654/numpy-get-random-set-of-rows-from-2d-array
 
         """
-        self.__num_foreground_object_in_scene = random.randint(self.num_foreground_object_in_scene_range["min"], self.num_foreground_object_in_scene_range["max"])
+        self.__num_foreground_object_in_scene = int(self.__rng.integers(self.num_foreground_object_in_scene_range.min, self.num_foreground_object_in_scene_range.max, endpoint = True))
         # PoissonDiskSampling
         self.__posson_disc_sampling()
         # Select particles which can see in cam view
@@ -199,22 +276,17 @@ class ForegroundObjectPlacementRandomizer:
         # Import background object asset
         self.__import_foreground_object_asset()
         # Randomly select n(n=num_foreground_object_in_scene) location from __particle_coordinates [1]
-        selected_indices = np.random.choice(self.__particle_coordinates.shape[0], 
-                                            size = self.__num_foreground_object_in_scene, 
-                                            replace = False)
-        fg_location = self.__particle_coordinates[selected_indices]
+        # Rows are drawn directly into a new C-contiguous array, their order is irrelevant as each goes to one armature
+        fg_location = self.__rng.choice(self.__particle_coordinates,
+                                        size = self.__num_foreground_object_in_scene,
+                                        replace = False, axis = 0, shuffle = False)
         print("fg_num: {} ".format(len(fg_location)))
         print("fg_location:\n {} ".format(fg_location))
 
-        # Move all foregeound objects to fg_location
-        fg_obj_list = []
-        for fg_obj in self.__foreground_object_collection.objects:
-            if fg_obj.type == "ARMATURE": # Select armature object only
-                fg_obj_list.append(fg_obj)
-
-        for i in range(self.__num_foreground_object_in_scene):
-            obj_location = (fg_location[i][0],fg_location[i][1], fg_location[i][2])
-            fg_obj_list[i].location = obj_location
+        # Move all foregeound objects to fg_location, only the few recorded armatures are touched
+        fg_obj_list = self.__armature_object_list[:self.__num_foreground_object_in_scene]
+        for fg_obj, obj_location in zip(fg_obj_list, fg_location):
+            fg_obj.location = tuple(obj_location)
         
         print("Particles in cam view num : {}".format(self.__n_particle)) # Show particle in cam view num
         print("Foreground Object Placement Randomize COMPLERED !!!")
@@ -1,13 +1,11 @@
 import bpy
-from bpy_extras.object_utils import world_to_camera_view
 import numpy as np
 from util import poissonDiscSampling
+from util.cameraView import points_in_camera_view
 import math
-import random
-from mathutils import Euler, Vector
-import os
-import glob
-import sys
+from mathutils import Euler
+from util.cachedGlob import asset_path_list
+from util.valueRange import Range
 
 
 class OccluderPlacementRandomizer:
@@ -24,16 +22,18 @@ class OccluderPlacementRandomizer:
     __camera (bpy.types.Camera): The blender camera data-block.
     __clip_start (float): Camera near clipping distance.
     __clip_end (float): Camera far clipping distance.
-    num_occluder_in_scene_range (dict of str: int): The distribution of the number of occlusion objects within the blender scene.
+    num_occluder_in_scene_range (Range of int): The distribution of the number of occlusion objects within the blender scene.
     __num_occluder_in_scene (int): The number of occlusion objects within the blender scene.
     occluder_area (list of float): Spatial distribution area of occlusion objects.
     __occluder_domain_size (numpy.ndarray): Spatial distribution area of occlusion objects.
     occluder_poisson_disk_sampling_radius (float): Occlusion objects separation distance.
+    occluder_poisson_disk_cell_size (float): Side of the sampler background grid cell, None to let the sampler compute it.
     asset_occluder_folder_path (str): The path to occlusion object assets.
+    asset_occluder_path_list (sequence of str): The sorted paths to the occlusion object assets, None to list asset_occluder_folder_path.
     __occluder_collection (bpy.types.Collection): The blender collection data-block of occlusion objects.
     __n_particle (int): Number of generated particles of the poisson disks sampling.
     __particle_coordinates (numpy.ndarray): Coordinates of the poisson disks sampling.
-    __particle_coordinates_can_see_in_view
+    __rng (numpy.random.Generator): Random generator of the occluder number, asset and location selection, built from the seed argument (None, int or numpy.random.Generator).
 
     Methods
     -------
@@ -47,10 +47,13 @@ class OccluderPlacementRandomizer:
     """
 
     def __init__(self, 
-                num_occluder_in_scene_range = {"min": 5 , "max": 10}, # must <= 50
+                num_occluder_in_scene_range = Range(5, 10), # must <= 50
                 occluder_area = [2.5, 1.5, 0.5],
                 occluder_poisson_disk_sampling_radius = 0.25,
-                asset_occluder_folder_path = "C:/Users/user/Documents/project/synthDet/Asset/occluder"
+                occluder_poisson_disk_cell_size = None,
+                asset_occluder_folder_path = "C:/Users/user/Documents/project/synthDet/Asset/occluder",
+                asset_occluder_path_list = None,
+                seed = None
                 ):
         self.__scene = bpy.data.scenes["Scene"]
         self.__camera = bpy.data.objects['Camera']
@@ -61,11 +64,13 @@ class OccluderPlacementRandomizer:
         self.occluder_area = occluder_area
         self.__occluder_domain_size = np.array(self.occluder_area)
         self.occluder_poisson_disk_sampling_radius = occluder_poisson_disk_sampling_radius
+        self.occluder_poisson_disk_cell_size = occluder_poisson_disk_cell_size
         self.asset_occluder_folder_path = asset_occluder_folder_path
+        self.asset_occluder_path_list = asset_occluder_path_list
         self.__occluder_collection = bpy.data.collections["OccluderCollection"]
         self.__n_particle = None
         self.__particle_coordinates = None # np.array
-        self.__particle_coordinates_can_see_in_view = list()
+        self.__rng = np.random.default_rng(seed)
 
 
     def __error_check(self,asset_path_list):
@@ -77,9 +82,7 @@ class OccluderPlacementRandomizer:
         """
         num_asset_in_folder = len(asset_path_list)
         if num_asset_in_folder < 1:
-            print(f'ERROR!!! can not find any occluder asset in {self.asset_occluder_folder_path}')
-            input("Press Enter to continue...")
-            sys.exit()
+            raise FileNotFoundError(f'can not find any occluder asset in {self.asset_occluder_folder_path}')
 
 
     def __load_object(self,filepath):
@@ -107,30 +110,30 @@ class OccluderPlacementRandomizer:
 
     def __posson_disc_sampling(self):
         """Generate the sampling with a spatially variable sampling radius."""
-        # It seem like function poisson_disc_sampling sometimes will break (mtbf:2000-3000 cycle), when it break , return a empty list[]
-        # add condition check len(self.__particle_coordinates) must >= 1
-        while self.__n_particle == None or self.__n_particle == 0:
-            self.__particle_coordinates = poissonDiscSampling.poisson_disc_sampling(radius = self.occluder_poisson_disk_sampling_radius,
-                                                                            sample_domain_size = self.__occluder_domain_size,
-                                                                            sample_rejection_threshold = 30)
-                                                                            
-            self.__n_particle = len(self.__particle_coordinates)
-            
+        # Center the domain on x, y and lift it 6.5 above the ground, the sampler emits world coordinates directly
+        loc_offset = np.array([-self.__occluder_domain_size[0]/2,-self.__occluder_domain_size[1]/2,6.5])
+        # Bridson sampling always keeps its initial sample, so the result is never empty
+        self.__particle_coordinates = poissonDiscSampling.poisson_disc_sampling(radius = self.occluder_poisson_disk_sampling_radius,
+                                                                        sample_domain_size = self.__occluder_domain_size,
+                                                                        sample_rejection_threshold = 30,
+                                                                        seed = int(self.__rng.integers(2**31)),
+                                                                        origin = loc_offset,
+                                                                        cell_size = self.occluder_poisson_disk_cell_size)
+        self.__n_particle = len(self.__particle_coordinates)
+        assert self.__n_particle >= 1, "poisson disc sampling returned no particle"
+
         print(f"nParticle Prev : {self.__n_particle}") # Show posson disc sampling caculated particle num
-        loc_offset = np.array([self.__occluder_domain_size[0]/2,self.__occluder_domain_size[1]/2,-6.5])
-        self.__particle_coordinates -= loc_offset
 
 
     def __import_occluder_asset(self):
         """Import a number of __n_particle occlusion objects into current blender scene."""  
-        # Check n_particle must bigger than num_occluder_in_scene
+        # Clip num_occluder_in_scene to n_particle, so there is a location for every occluder
         if self.__n_particle < self.__num_occluder_in_scene:
-            print('Warning!!! nParticle:{} must bigger than num_occluder_in_scene:{}'.format(self.__n_particle,self.__num_occluder_in_scene))
-            input("Press Enter to continue...") 
-            sys.exit()
+            print('Warning!!! nParticle:{} smaller than num_occluder_in_scene:{}, clip num_occluder_in_scene'.format(self.__n_particle,self.__num_occluder_in_scene))
+            self.__num_occluder_in_scene = self.__n_particle
         
         # Get occluder asset path
-        occluder_path_list = glob.glob(os.path.join(self.asset_occluder_folder_path, "*.blend"))
+        occluder_path_list = asset_path_list(self.asset_occluder_path_list, self.asset_occluder_folder_path, "*.blend")
         self.__error_check(asset_path_list = occluder_path_list)
         num_occluder = len(occluder_path_list)
         print("num occluder in folder: {}".format(num_occluder))
@@ -151,7 +154,7 @@ class OccluderPlacementRandomizer:
 
         else:
             # Randomly select n(n=num_occluder_in_scene) occluder from occluder_path_list, then import to scene
-            occluder_path_list_selected = random.sample(occluder_path_list, self.__num_occluder_in_scene)
+            occluder_path_list_selected = self.__rng.choice(occluder_path_list, size = self.__num_occluder_in_scene, replace = False)
             for occluder_path in occluder_path_list_selected:
                 self.__load_object(filepath = occluder_path)
 
@@ -161,24 +164,19 @@ class OccluderPlacementRandomizer:
 
         References
         ----------
-        https://blender.stackexchange.com/questions/284884/what-does-world-to-camera-view-depend-on
         https://blender.stackexchange.com/questions/258000/how-to-update-world-transformation-matrices-without-calling-a-scene-update/258002#258002
 
         """
          # Update camera object matrix_world
         self.__camera.matrix_world = self.__camera.matrix_basis
-        
-        for coordinates in self.__particle_coordinates:
-            # World space to ndc space
-            vector_p = Vector(coordinates)
-            co_ndc = world_to_camera_view(self.__scene, self.__camera, vector_p)
-            # Check wether point is inside frustum
-            if (0.0 < co_ndc.x < 1.0 and 0.0 < co_ndc.y < 1.0 and self.__clip_start < co_ndc.z < self.__clip_end):
-                 self.__particle_coordinates_can_see_in_view.append(coordinates)
-                
+
+        # Keep only the particles inside the camera frustum
+        particle_coordinates = np.asarray(self.__particle_coordinates, dtype = np.float64)
+        in_view = points_in_camera_view(self.__scene, self.__camera, particle_coordinates, self.__clip_start, self.__clip_end)
+
         # Update __particle_coordinates and __n_particle var value
-        self.__particle_coordinates = np.array(self.__particle_coordinates_can_see_in_view)
-        self.__n_particle = len(self.__particle_coordinates_can_see_in_view)
+        self.__particle_coordinates = particle_coordinates[in_view]
+        self.__n_particle = len(self.__particle_coordinates)
     
 
     def occluder_placement_randomize(self):
@@ -189,7 +187,7 @@ class OccluderPlacementRandomizer:
         [1]https://stackoverflow.com/questions/14262654/numpy-get-random-set-of-rows-from-2d-array
 
         """
-        self.__num_occluder_in_scene = random.randint(self.num_occluder_in_scene_range["min"], self.num_occluder_in_scene_range["max"])
+        self.__num_occluder_in_scene = int(self.__rng.integers(self.num_occluder_in_scene_range.min, self.num_occluder_in_scene_range.max, endpoint = True))
         # PoissonDiskSampling
         self.__posson_disc_sampling()
         # Select particles which can see in cam view
@@ -197,7 +195,7 @@ class OccluderPlacementRandomizer:
         # Import occluder asset
         self.__import_occluder_asset()
         # Randomly select n(n=num_occluder_in_scene) location from __particle_coordinates [1]
-        selected_indices = np.random.choice(self.__particle_coordinates.shape[0], 
+        selected_indices = self.__rng.choice(self.__particle_coordinates.shape[0], 
                                             size = self.__num_occluder_in_scene, 
                                             replace = False)
         occluder_location = self.__particle_coordinates[selected_indices]
@@ -1,5 +1,6 @@
 import bpy
-import random
+import numpy as np
+from util.valueRange import Range
 
 
 class ObjectScaleRandomizer:
@@ -8,12 +9,13 @@ class ObjectScaleRandomizer:
 
     Attributes
     ----------
-    bg_obj_scale_ratio_range (dict of str: float): The distribution of the scale ratio of background objects within the blender scene.
-    fg_obj_scale_ratio_range (dict of str: float): The distribution of the scale ratio of foreground objects within the blender scene.
-    occluder_scale_ratio_range (dict of float): The distribution of the scale ratio of occluder objects within the blender scene.
+    bg_obj_scale_ratio_range (Range of float): The distribution of the scale ratio of background objects within the blender scene.
+    fg_obj_scale_ratio_range (Range of float): The distribution of the scale ratio of foreground objects within the blender scene.
+    occluder_scale_ratio_range (Range of float): The distribution of the scale ratio of occluder objects within the blender scene.
     __background_object_collection (bpy.types.Collection): The blender collection data-block of background objects.
     __foreground_object_collection (bpy.types.Collection): The blender collection data-block of foreground objects.
     __occluder_collection (bpy.types.Collection): The blender collection data-block of occlusion objects.
+    __rng (numpy.random.Generator): Random generator of the scale ratios, built from the seed argument (None, int or numpy.random.Generator).
 
     Methods
     -------
@@ -26,9 +28,10 @@ class ObjectScaleRandomizer:
     """ 
 
     def __init__(self, 
-                bg_obj_scale_ratio_range = {"min": 6, "max": 6},
-                fg_obj_scale_ratio_range = {"min": 0.8, "max": 1.5},
-                occluder_scale_ratio_range = {"min": 0.5, "max": 1.2}):
+                bg_obj_scale_ratio_range = Range(6, 6),
+                fg_obj_scale_ratio_range = Range(0.8, 1.5),
+                occluder_scale_ratio_range = Range(0.5, 1.2),
+                seed = None):
 
         self.bg_obj_scale_ratio_range = bg_obj_scale_ratio_range
         self.fg_obj_scale_ratio_range = fg_obj_scale_ratio_range
@@ -36,6 +39,7 @@ class ObjectScaleRandomizer:
         self.__background_object_collection = bpy.data.collections["BackgroundObjectCollection"]
         self.__foreground_object_collection = bpy.data.collections["HumanCollection"]
         self.__occluder_collection = bpy.data.collections["OccluderCollection"]
+        self.__rng = np.random.default_rng(seed)
 
 
     def __armature_scale_randomize(self, collection, armature_scale_ratio_range):
@@ -43,16 +47,16 @@ class ObjectScaleRandomizer:
 
         Args:
             collection (bpy.types.Collection): The blender collection data-block of scaled objects.
-            armature_scale_ratio_range (dict of str: float): The distribution of the scale ratio of armature objects.
+            armature_scale_ratio_range (Range of float): The distribution of the scale ratio of armature objects.
 
         """ 
         for obj in collection.objects:
             if obj.type == "ARMATURE": # Select armature object only
-                if armature_scale_ratio_range["min"] == armature_scale_ratio_range["max"]:
-                    scale_ratio = armature_scale_ratio_range["max"]
+                if armature_scale_ratio_range.min == armature_scale_ratio_range.max:
+                    scale_ratio = armature_scale_ratio_range.max
                 else:
-                    scale_ratio = random.randrange(int(armature_scale_ratio_range["min"]*10),
-                                        int(armature_scale_ratio_range["max"]*10), 1)/10
+                    scale_ratio = int(self.__rng.integers(int(armature_scale_ratio_range.min*10),
+                                                          int(armature_scale_ratio_range.max*10)))/10
                 prev_size = obj.dimensions.xyz
                 scale_size = prev_size * scale_ratio
                 obj.dimensions.xyz = scale_size[0], scale_size[1], scale_size[2] 
@@ -65,15 +69,15 @@ class ObjectScaleRandomizer:
 
         Args:
             collection (bpy.types.Collection): The blender collection data-block of scaled objects.
-            obj_scale_ratio_range (dict of str: float): The distribution of the scale ratio of objects.
+            obj_scale_ratio_range (Range of float): The distribution of the scale ratio of objects.
 
         """  
         for obj in collection.objects:
-            if obj_scale_ratio_range["min"] == obj_scale_ratio_range["max"]:
-                scale_ratio = obj_scale_ratio_range["max"]
+            if obj_scale_ratio_range.min == obj_scale_ratio_range.max:
+                scale_ratio = obj_scale_ratio_range.max
             else:
-                scale_ratio = random.randrange(int(obj_scale_ratio_range["min"]*10),
-                                    int(obj_scale_ratio_range["max"]*10), 1)/10
+                scale_ratio = int(self.__rng.integers(int(obj_scale_ratio_range.min*10),
+                                                      int(obj_scale_ratio_range.max*10)))/10
             prev_size = obj.dimensions.xyz
             scale_size = prev_size * scale_ratio
             obj.dimensions.xyz = scale_size[0], scale_size[1], scale_size[2]
@@ -1,7 +1,6 @@
 import bpy 
 import os 
-import random
-import sys
+import numpy as np
 
 
 class TextureRandomizer:
@@ -18,6 +17,7 @@ class TextureRandomizer:
     __objects_need_assign_material (list of bpy.types.Object): A list of the blender objects which need to apply material.
     __asset_base_image_path_list (list of str): All color map img paths from asset_ambientCGMaterial_folder_path.
     __randomly_selected_base_image_path_list (list of str): A list of randomly selected color map img paths.
+    __rng (numpy.random.Generator): Random generator of the material selection, built from the seed argument (None, int or numpy.random.Generator).
 
     Methods
     -------
@@ -36,13 +36,14 @@ class TextureRandomizer:
 
     """
 
-    def __init__(self, asset_ambientCGMaterial_folder_path = "C:/Users/user/Documents/project/synthDet/Asset/blenderproc_asset/cc_texture"):       
+    def __init__(self, asset_ambientCGMaterial_folder_path = "C:/Users/user/Documents/project/synthDet/Asset/blenderproc_asset/cc_texture", seed = None):       
         
         self.asset_ambientCGMaterial_folder_path = asset_ambientCGMaterial_folder_path
         self.__collections_need_assign_material = [bpy.data.collections["OccluderCollection"], bpy.data.collections["BackgroundObjectCollection"]]
         self.__objects_need_assign_material = list()
         self.__asset_base_image_path_list = list()
         self.__randomly_selected_base_image_path_list = list()
+        self.__rng = np.random.default_rng(seed)
 
 
     def __get_all_material_image_paths(self):
@@ -50,7 +51,8 @@ class TextureRandomizer:
         folder_path = self.asset_ambientCGMaterial_folder_path
 
         # Get all base_image path from self.asset_ambientCGMaterial_folder_path
-        for asset in os.listdir(folder_path):
+        # Sorted, listdir order is file system dependent
+        for asset in sorted(os.listdir(folder_path)):
             asset_path = os.path.join(folder_path, asset)
             if os.path.isdir(asset_path):
                 base_image_path = os.path.join(asset_path, f"{asset}_2K_Color.jpg")
@@ -69,8 +71,8 @@ class TextureRandomizer:
         """Randomly select material."""
         num_objects_need_assign_material = len(self.__objects_need_assign_material)
 
-        self.__randomly_selected_base_image_path_list =  \
-        random.choices(self.__asset_base_image_path_list, k = num_objects_need_assign_material)
+        selected_indices = self.__rng.integers(len(self.__asset_base_image_path_list), size = num_objects_need_assign_material)
+        self.__randomly_selected_base_image_path_list = [self.__asset_base_image_path_list[i] for i in selected_indices]
 
 
     def __create_and_assign_material(self):
@@ -80,9 +82,7 @@ class TextureRandomizer:
 
         # Check num_materials is equal to num_objs
         if num_materials != num_objs:
-            print(f"Warning!!! num_materials: {num_materials} not equal to num_objs: {num_objs}") 
-            input("Press Enter to continues...")
-            sys.exit()
+            raise RuntimeError(f"num_materials: {num_materials} not equal to num_objs: {num_objs}")
 
         for i in range(num_materials):
             current_obj = self.__objects_need_assign_material[i]
@@ -1,6 +1,6 @@
 import bpy 
 import math
-import random
+import numpy as np
 from mathutils import Euler
 
 
@@ -11,6 +11,7 @@ class RotationRandomizer:
     Attributes
     ----------
     __collections_for_rotation_randomize (list of bpy.types.Collection): List of the blender collections which need to been rotated.
+    __rng (numpy.random.Generator): Random generator of the rotations, built from the seed argument (None, int or numpy.random.Generator).
 
     Methods
     -------
@@ -18,17 +19,18 @@ class RotationRandomizer:
 
     """
 
-    def __init__(self):
+    def __init__(self, seed = None):
         self.__collections_for_rotation_randomize = [bpy.data.collections["OccluderCollection"],
                                                    bpy.data.collections['BackgroundObjectCollection']]
+        self.__rng = np.random.default_rng(seed)
     
 
     def rotation_randomize(self):
         """Applies random rotation to all objects in background and occluder collections.""" 
         for collection in self.__collections_for_rotation_randomize:
             for obj_to_rotate in collection.objects:
-                random_rot = (random.random() * 2 * math.pi, random.random() * 2 * math.pi, random.random() * 2 * math.pi)
-                obj_to_rotate.rotation_euler = Euler(random_rot, 'XYZ')
+                random_rot = self.__rng.random(3) * 2 * math.pi
+                obj_to_rotate.rotation_euler = Euler(random_rot.tolist(), 'XYZ')
              
         print("Rotation Randomize COMPLERED !!!")
 
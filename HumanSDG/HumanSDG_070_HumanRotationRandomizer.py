@@ -1,6 +1,6 @@
 import bpy 
 import math
-import random
+import numpy as np
 from mathutils import Euler
 
 
@@ -12,6 +12,7 @@ class HumanRotationRandomizer:
     Attributes
     ----------
     __collection_for_human_rotation_randomize (list of bpy.types.Collection): List of the blender collections which need to been rotated.
+    __rng (numpy.random.Generator): Random generator of the rotations, built from the seed argument (None, int or numpy.random.Generator).
 
     Methods
     -------
@@ -20,8 +21,9 @@ class HumanRotationRandomizer:
 
     """
 
-    def __init__(self):
+    def __init__(self, seed = None):
         self.__collection_for_human_rotation_randomize = bpy.data.collections["HumanCollection"]
+        self.__rng = np.random.default_rng(seed)
 
 
     def __get_random_rotation(self):
@@ -32,9 +34,9 @@ class HumanRotationRandomizer:
 
         """ 
         random_rot = (
-                random.uniform(-30/360, 30/360) * 2 * math.pi, # X axis rotation range -30~30
-                random.uniform(0/360, 360/360) * 2 * math.pi, # Y axis rotation range 0~360
-                random.uniform(-30/360, 30/360) * 2 * math.pi  # Z axis rotation range -30~30
+                self.__rng.uniform(-30/360, 30/360) * 2 * math.pi, # X axis rotation range -30~30
+                self.__rng.uniform(0/360, 360/360) * 2 * math.pi, # Y axis rotation range 0~360
+                self.__rng.uniform(-30/360, 30/360) * 2 * math.pi  # Z axis rotation range -30~30
                 ) 
         return random_rot
 
@@ -1,9 +1,8 @@
 import bpy
-import os
-from glob import glob
-import random
+import numpy as np
 import math
-import sys
+from util.cachedGlob import asset_path_list
+from util.valueRange import Range
 
 
 class LightRandomizer:
@@ -14,11 +13,15 @@ class LightRandomizer:
     Attributes
     ----------
     asset_hdri_lighting_folder_path (str): The path to the downloaded Poly Haven HDRIs.
-    hdri_lighting_strength_range (dict of str: float): The distribution of the strength factor for the intensity of the HDRI scene light.
+    asset_hdri_lighting_path_list (sequence of str): The sorted paths to the HDRIs, None to list asset_hdri_lighting_folder_path.
+    hdri_lighting_strength_range (Range of float): The distribution of the strength factor for the intensity of the HDRI scene light.
+    __rng (numpy.random.Generator): Random generator of the lighting selection, strength and rotation, built from the seed argument (None, int or numpy.random.Generator).
+    __hdri_lighting_image_dict (dict of str: bpy.types.Image): Pool of the HDRI image data-blocks already loaded.
 
     Methods
     -------
     __error_check(): Check assigned HDRI assets folder path isn't empty.
+    __get_hdri_lighting_image(): Get the image data-block of a HDRI asset.
     __create_world_shader_nodes(): Create world shader node group.
     light_randomize(): Randomly apply a HDRI lighting and adjust light intensity.
 
@@ -30,19 +33,37 @@ class LightRandomizer:
 
     def __init__(self,
                 asset_hdri_lighting_folder_path = "C:/Users/user/Documents/project/synthDet/Asset/Lighting/HDRI",
-                hdri_lighting_strength_range = {"min": 0.1 , "max": 2}
+                asset_hdri_lighting_path_list = None,
+                hdri_lighting_strength_range = Range(0.1, 2),
+                seed = None
                 ):
         self.asset_hdri_lighting_folder_path = asset_hdri_lighting_folder_path
+        self.asset_hdri_lighting_path_list = asset_hdri_lighting_path_list
         self.hdri_lighting_strength_range = hdri_lighting_strength_range
+        self.__rng = np.random.default_rng(seed)
+        self.__hdri_lighting_image_dict = dict() # Data format : {'hdri_path': image, ...}
 
 
     def __error_check(self,asset_path_list):
         """Check assigned HDRI assets folder path isn't empty."""
         num_asset_in_folder = len(asset_path_list)
         if num_asset_in_folder < 1:
-            print(f'ERROR!!! can not find any light asset in {self.asset_hdri_lighting_folder_path}')
-            input("Press Enter to continue...")
-            sys.exit()
+            raise FileNotFoundError(f'can not find any light asset in {self.asset_hdri_lighting_folder_path}')
+
+
+    def __get_hdri_lighting_image(self, filepath):
+        """Get the image data-block of a HDRI asset, each EXR file is only loaded once.
+
+        Args:
+            filepath (str): The path to the HDRI asset.
+
+        Return:
+            (bpy.types.Image): The image data-block of the HDRI asset.
+
+        """
+        if filepath not in self.__hdri_lighting_image_dict:
+            self.__hdri_lighting_image_dict[filepath] = bpy.data.images.load(filepath, check_existing = True)
+        return self.__hdri_lighting_image_dict[filepath]
 
 
     def __create_world_shader_nodes(self):
@@ -79,7 +100,10 @@ class LightRandomizer:
 
     def light_randomize(self):
         """Randomly apply a HDRI lighting and adjust light intensity.""" 
-        self.__create_world_shader_nodes()
+        # Build the world shader nodes once, later calls only update the image, strength and rotation inputs
+        world = bpy.data.worlds['World']
+        if not world.use_nodes or world.node_tree is None or "Environment Texture" not in world.node_tree.nodes:
+            self.__create_world_shader_nodes()
 
         # Background node reference
         node_Background = bpy.data.worlds['World'].node_tree.nodes["Background"]
@@ -89,24 +113,23 @@ class LightRandomizer:
         node_MappingLighting = bpy.data.worlds["World"].node_tree.nodes["Mapping"]
 
         # Get hdri lighting asset path
-        hdri_lighting_path_list = glob(os.path.join(self.asset_hdri_lighting_folder_path, "*.exr"))
+        hdri_lighting_path_list = asset_path_list(self.asset_hdri_lighting_path_list, self.asset_hdri_lighting_folder_path, "*.exr")
         self.__error_check(asset_path_list = hdri_lighting_path_list)
 
         # Randomly select a hdri lighting, then add hdri lighting to node_EnvironmentTexture
-        hdri_lighting_selected = random.sample(hdri_lighting_path_list, 1)
-        hdri_lighting = bpy.data.images.load(hdri_lighting_selected[0])
+        hdri_lighting_selected = hdri_lighting_path_list[self.__rng.integers(len(hdri_lighting_path_list))]
+        hdri_lighting = self.__get_hdri_lighting_image(hdri_lighting_selected)
         node_EnvironmentTexture.image = hdri_lighting
 
-        # Randomly set lighting strength
-        max = int(self.hdri_lighting_strength_range["max"] * 10)
-        min = int(self.hdri_lighting_strength_range["min"] * 10)
-        lighting_strength = random.randrange(min, max,1)/10
+        # Randomly draw lighting strength and rotation in one call
+        lighting_strength, random_rot_x, random_rot_y, random_rot_z = self.__rng.uniform(
+            [self.hdri_lighting_strength_range.min, -math.pi/6, -math.pi/6, 0], # -30, -30, 0 degree
+            [self.hdri_lighting_strength_range.max, 2*math.pi/3, math.pi/6, 2*math.pi]) # +120, +30, 360 degree
+
+        # Set lighting strength
         node_Background.inputs["Strength"].default_value = lighting_strength
 
-        # Randomly rotate lighting
-        random_rot_x = random.uniform(-30/360, 120/360) * 2 * math.pi # -30~+120 degree
-        random_rot_y = random.uniform(-30/360, 30/360) * 2 * math.pi # -30~+30 degree
-        random_rot_z = random.uniform(0,360/360)  * 2* math.pi # 0~360 degree
+        # Rotate lighting
         node_MappingLighting.inputs["Rotation"].default_value[0] =  random_rot_x
         node_MappingLighting.inputs["Rotation"].default_value[1] =  random_rot_y
         node_MappingLighting.inputs["Rotation"].default_value[2] =  random_rot_z
@@ -1,8 +1,6 @@
 import bpy
-import os
-import glob
-import sys
-import random
+from util.cachedGlob import asset_path_list
+import numpy as np
 
 
 class AnimationRandomizer:
@@ -13,11 +11,13 @@ class AnimationRandomizer:
     Attributes
     ----------
     asset_animation_folder_path (str): The path to the animation assets directory.
+    asset_animation_path_list (sequence of str): The sorted paths to the animation assets, None to list asset_animation_folder_path.
     __collection_need_to_assign_animation (bpy.types.Collection): The blender collection which need to apply animation.
     __armatures_need_to_assign_animation_list (list of bpy.types.Armature): A list of the blender armatures which need to apply animation.
     __animation_list (list of bpy.types.Action): All animation data in current blender file.
     __animation_name_list (list of str): All animation names in current blender file.
     __animation_num (int): Number of animation data in current blender file.
+    __rng (numpy.random.Generator): Random generator of the animation and frame selection, built from the seed argument (None, int or numpy.random.Generator).
 
     Methods
     -------
@@ -37,22 +37,22 @@ class AnimationRandomizer:
 
     """ 
 
-    def __init__(self, asset_animation_folder_path = "C:/Users/user/Documents/project/PeopleSansPeople/Asset/Animation/WIP/Frame250"):
+    def __init__(self, asset_animation_folder_path = "C:/Users/user/Documents/project/PeopleSansPeople/Asset/Animation/WIP/Frame250", asset_animation_path_list = None, seed = None):
         self.asset_animation_folder_path = asset_animation_folder_path
+        self.asset_animation_path_list = asset_animation_path_list
         self.__collection_need_to_assign_animation = bpy.data.collections["HumanCollection"]
         self.__armatures_need_to_assign_animation_list = list()
         self.__animation_list = list()
         self.__animation_name_list = list()
         self.__animation_num = 0
+        self.__rng = np.random.default_rng(seed)
 
 
     def __error_check(self,asset_path_list):
         """Check assigned animation assets folder path isn't empty."""
         num_asset_in_folder = len(asset_path_list)
         if num_asset_in_folder < 1:
-            print(f'ERROR!!! can not find any animation asset in {self.asset_animation_folder_path}')
-            input("Press Enter to continue...")
-            sys.exit()
+            raise FileNotFoundError(f'can not find any animation asset in {self.asset_animation_folder_path}')
 
 
     def __load_animation(self, filepath):
@@ -72,7 +72,7 @@ class AnimationRandomizer:
     def __import_animation_asset(self):
         """Import all animation data from the animation dataset into the current blender file.""" 
         # Get animation asset path
-        animation_path_list = glob.glob(os.path.join(self.asset_animation_folder_path, "*.blend"))
+        animation_path_list = asset_path_list(self.asset_animation_path_list, self.asset_animation_folder_path, "*.blend")
         self.__error_check(asset_path_list = animation_path_list)
 
         # Load all animation data into current blend file
@@ -97,14 +97,14 @@ class AnimationRandomizer:
             # Create empty action
             armature.animation_data_create()
             # Random select one animation from animation_list
-            animation_selected = random.sample(self.__animation_list, 1)
+            animation_selected = self.__animation_list[self.__rng.integers(len(self.__animation_list))]
             # Assign animation to armature
-            armature.animation_data.action  = animation_selected[0]
+            armature.animation_data.action  = animation_selected
 
 
     def __random_frame(self):
         """Randomly select currect blender scene frame number.""" 
-        random_frame = random.randint(1,250)
+        random_frame = int(self.__rng.integers(1, 250, endpoint = True))
         print(f'random_frame: {random_frame}')
 
         bpy.data.scenes['Scene'].frame_set(random_frame)
@@ -1,7 +1,8 @@
 import bpy
 from util.RandomThreeVector import random_three_vector # [1]
 import numpy as np
-import random
+from util.augmentationSampling import pack_augmentations, sample_augmentations
+from util.valueRange import Range
 
 
 class CameraRandomizer:
@@ -17,25 +18,26 @@ class CameraRandomizer:
     img_resolution_y (int): Number of vertical pixels in the rendered image.
     max_samples (int): Number of samples to render for each pixel.
     chromatic_aberration_probability (float): Probability of chromatic aberration effect being enabled.
-    chromatic_aberration_value_range (dict of str: float): The distribution of the value of Lens Distortion nodes input-Dispersion, which simulates chromatic aberration.
+    chromatic_aberration_value_range (Range of float): The distribution of the value of Lens Distortion nodes input-Dispersion, which simulates chromatic aberration.
     blur_probability (float): Probability of blur effect being enabled.
-    blur_value_range (dict of str: int): The distribution of the value of Blur nodes input-Size, which controls the blur radius values.
+    blur_value_range (Range of int): The distribution of the value of Blur nodes input-Size, which controls the blur radius values.
     motion_blur_probability (float): Probability of motion blur effect being enabled.
-    motion_blur_value_range (dict of str: int): The distribution of the value of Vector Blur nodes input-Speed, which controls the direction of motion.
+    motion_blur_value_range (Range of int): The distribution of the value of Vector Blur nodes input-Speed, which controls the direction of motion.
     exposure_probability (float): Probability of exposure adjustment being enabled.
-    exposure_value_range (dict of str: float): The distribution of the value of Exposure nodes input-Exposure, which controls the scalar factor to adjust the exposure.
+    exposure_value_range (Range of float): The distribution of the value of Exposure nodes input-Exposure, which controls the scalar factor to adjust the exposure.
     noise_probability (float): Probability of noise effect being enabled.
-    noise_value_range (dict of str: float): The distribution of the value of brightness of the noise texture.
+    noise_value_range (Range of float): The distribution of the value of brightness of the noise texture.
     white_balance_probability (float): Probability of white balance adjustment being enabled.
-    white_balance_value_range (dict of str: int): The distribution of the value of WhiteBalanceNode input-ColorTemperature, which adjust the color temperature.
+    white_balance_value_range (Range of int): The distribution of the value of WhiteBalanceNode input-ColorTemperature, which adjust the color temperature.
     brightness_probability (float): Probability of brightness adjustment being enabled.
-    brightness_value_range (dict of str: float): The distribution of the value of Bright/Contrast nodes input-Bright, which adjust the brightness.
+    brightness_value_range (Range of float): The distribution of the value of Bright/Contrast nodes input-Bright, which adjust the brightness.
     contrast_probability (float): Probability of contrast adjustment being enabled.
-    contrast_value_range (dict of str: float): The distribution of the value of Bright/Contrast nodes input-Contrast, which adjust the contrast.
+    contrast_value_range (Range of float): The distribution of the value of Bright/Contrast nodes input-Contrast, which adjust the contrast.
     hue_probability (float): Probability of hue adjustment being enabled.
-    hue_value_range (dict of str: float): The distribution of the value of Hue Saturation Value nodes input-Hue, which adjust the hue.
+    hue_value_range (Range of float): The distribution of the value of Hue Saturation Value nodes input-Hue, which adjust the hue.
     saturation_probability (float): Probability of saturation adjustment being enabled.
-    saturation_value_range (dict of str: float): The distribution of the value of Hue Saturation Value nodes input-Saturation, which adjust the saturation.
+    saturation_value_range (Range of float): The distribution of the value of Hue Saturation Value nodes input-Saturation, which adjust the saturation.
+    __rng (numpy.random.Generator): Random generator of the camera effects, built from the seed argument (None, int or numpy.random.Generator).
     __vector_blur_factor (float): Control the Vector Blur nodes input-Blur, which is the scaling factor for the motion vector.
     __curve_r_point_list (list of float): Convert Temperature (K) to RGB (sRGB) using RGB Curves node - red channel's curve data points.
     __curve_g_point_list (list of float): Convert Temperature (K) to RGB (sRGB) using RGB Curves node - green channel's curve data points.
@@ -94,25 +96,26 @@ class CameraRandomizer:
                  img_resolution_y = 480,
                  max_samples = 256,
                  chromatic_aberration_probability = 0,
-                 chromatic_aberration_value_range = {"min": 0.5, "max": 1},
+                 chromatic_aberration_value_range = Range(0.5, 1),
                  blur_probability = 0,
-                 blur_value_range = {"min": 2, "max": 3},
+                 blur_value_range = Range(2, 3),
                  motion_blur_probability = 0,
-                 motion_blur_value_range = {"min": 1, "max": 5},
+                 motion_blur_value_range = Range(1, 5),
                  exposure_probability = 0,
-                 exposure_value_range = {"min": -0.5, "max": 2},
+                 exposure_value_range = Range(-0.5, 2),
                  noise_probability = 0,
-                 noise_value_range = {"min": 1.6, "max": 1.8},
+                 noise_value_range = Range(1.6, 1.8),
                  white_balance_probability = 0,
-                 white_balance_value_range = {"min": 3500, "max": 9500},
+                 white_balance_value_range = Range(3500, 9500),
                  brightness_probability = 0,
-                 brightness_value_range = {"min": -1, "max": 1},
+                 brightness_value_range = Range(-1, 1),
                  contrast_probability = 0,
-                 contrast_value_range = {"min": -1, "max": 3},
+                 contrast_value_range = Range(-1, 3),
                  hue_probability = 0,
-                 hue_value_range = {"min": 0.45, "max": 0.55},
+                 hue_value_range = Range(0.45, 0.55),
                  saturation_probability = 0,
-                 saturation_value_range = {"min": 0.75, "max": 1.25},
+                 saturation_value_range = Range(0.75, 1.25),
+                 seed = None
                  ):
 
         self.camera_focal_length = camera_focal_length
@@ -143,6 +146,7 @@ class CameraRandomizer:
         self.saturation_probability = saturation_probability
         self.saturation_value_range = saturation_value_range
 
+        self.__rng = np.random.default_rng(seed)
         self.__vector_blur_factor = 10
         self.__curve_r_point_list = [[0.0, 0.0], 
                                      [0.02500000037252903, 1.0], [0.16249999403953552, 1.0], 
@@ -330,151 +334,93 @@ class CameraRandomizer:
         bpy.data.scenes["Scene"].node_tree.use_opencl = True
 
 
-    def __chromatic_aberration_randomize(self):
+    def __chromatic_aberration_randomize(self, enabled, value):
         """Randomizes the value of Lens Distortion nodes input-Dispersion, which simulates chromatic aberration[11]."""
         default_chromatic_aberration_value = 0
-        # Set happen distribution
-        chromatic_aberration_happen_distribution = [self.chromatic_aberration_probability, 1 - self.chromatic_aberration_probability]
-        # Chromatic_aberration randomize
-        chromatic_aberration_value_max = int(self.chromatic_aberration_value_range["max"] * 10)
-        chromatic_aberration_value_min = int(self.chromatic_aberration_value_range["min"] * 10)
-        random_chromatic_aberration_value = random.randrange(chromatic_aberration_value_min, chromatic_aberration_value_max + 1 ,1)/10
-        chromatic_aberration_value = random.choices([random_chromatic_aberration_value, default_chromatic_aberration_value], chromatic_aberration_happen_distribution)
+        chromatic_aberration_value = value if enabled else default_chromatic_aberration_value
         node_Lensdist = bpy.data.scenes['Scene'].node_tree.nodes["Lens Distortion"]
         node_Lensdist.use_projector = True
-        node_Lensdist.inputs['Dispersion'].default_value = chromatic_aberration_value[0]
+        node_Lensdist.inputs['Dispersion'].default_value = chromatic_aberration_value
 
 
-    def __blur_randomize(self):
+    def __blur_randomize(self, enabled, value):
         """Randomizes the value of Blur nodes input-Size, which controls the blur radius values[12].""" 
         default_blur_value = 0
-        # Set happen distribution
-        blur_happen_distribution = [self.blur_probability, 1 - self.blur_probability]
-        # Blur randomize
-        blur_value_max = int(self.blur_value_range["max"])
-        blur_value_min = int(self.blur_value_range["min"])
-        random_blur_value = random.randrange(blur_value_min, blur_value_max + 1 ,1)
-        blur_value = random.choices([random_blur_value, default_blur_value], blur_happen_distribution)
+        # Blur size is an integer number of pixels, value is already drawn from the integers of the range
+        blur_value = int(value) if enabled else default_blur_value
         node_Blur = bpy.data.scenes['Scene'].node_tree.nodes["Blur"]
-        node_Blur.size_x = blur_value[0]
-        node_Blur.size_y = blur_value[0]
+        node_Blur.size_x = blur_value
+        node_Blur.size_y = blur_value
 
 
-    def __motion_blur_randomize(self):
+    def __motion_blur_randomize(self, enabled, value):
         """Randomizes the value of Vector Blur nodes input-Speed, which controls the direction of motion[13].""" 
         default_motion_blur_vector = (0,0,0)
-        # Set happen distribution
-        motion_blur_happen_distribution = [self.motion_blur_probability, 1 - self.motion_blur_probability]
-        # Motion blur randomize
-        motion_blur_value_max = int(self.motion_blur_value_range["max"])
-        motion_blur_value_min = int(self.motion_blur_value_range["min"])
-        n = random.randrange(motion_blur_value_min, motion_blur_value_max + 1, 1)
-        random_vector = random_three_vector()
-        random_motion_blur_vector = (random_vector[0] * n, random_vector[1] * n, random_vector[2] * n)
-        motion_blur_vector = random.choices([random_motion_blur_vector, default_motion_blur_vector], motion_blur_happen_distribution)
+        if enabled:
+            random_vector = random_three_vector(self.__rng)
+            motion_blur_vector = (random_vector[0] * value, random_vector[1] * value, random_vector[2] * value)
+        else:
+            motion_blur_vector = default_motion_blur_vector
         node_VectorBlur = bpy.data.scenes['Scene'].node_tree.nodes["Vector Blur"]
         node_VectorBlur.factor = self.__vector_blur_factor
-        node_VectorBlur.inputs["Speed"].default_value = motion_blur_vector[0]
+        node_VectorBlur.inputs["Speed"].default_value = motion_blur_vector
 
 
-    def __exposure_randomize(self):
+    def __exposure_randomize(self, enabled, value):
         """Randomizes the value of Exposure nodes input-Exposure, which controls the scalar factor to adjust the exposure[14]."""
         default_exposure_value = 0
-        # Set happen distribution
-        exposure_happen_distribution = [self.exposure_probability, 1 - self.exposure_probability]
-        # Exposure randomize
-        exposure_value_max = int(self.exposure_value_range["max"] * 10)
-        exposure_value_min = int(self.exposure_value_range["min"] * 10)
-        random_exposure_value = random.randrange(exposure_value_min, exposure_value_max + 1 ,1)/10
-        exposure_value = random.choices([random_exposure_value, default_exposure_value],exposure_happen_distribution)
+        exposure_value = value if enabled else default_exposure_value
         node_Exposure = bpy.data.scenes['Scene'].node_tree.nodes["Exposure"]
-        node_Exposure.inputs['Exposure'].default_value = exposure_value[0]
+        node_Exposure.inputs['Exposure'].default_value = exposure_value
 
 
-    def __noise_randomize(self):
+    def __noise_randomize(self, enabled, value):
         """Randomizes the value of brightness of the noise texture[15]."""
-        # Set happen distribution
-        noise_happen_distribution = [self.noise_probability, 1 - self.noise_probability]
-        # Noise randomize
-        noise_value_max = int(self.noise_value_range["max"] * 10)
-        noise_value_min = int(self.noise_value_range["min"] * 10)
-        random_noise_value = random.randrange(noise_value_min, noise_value_max + 1 ,1)/10
-        bpy.data.textures["camera_sensor_noise"].intensity = random_noise_value
+        bpy.data.textures["camera_sensor_noise"].intensity = value
         noise_mix_fac_list = [0.25, 0.5, 0.75, 1]
-        noise_mix_fac =  random.choice(noise_mix_fac_list)
-        noise_mix_value = random.choices([noise_mix_fac,0], noise_happen_distribution)
+        noise_mix_value = self.__rng.choice(noise_mix_fac_list) if enabled else 0
         node_Mix = bpy.data.scenes["Scene"].node_tree.nodes["Mix"]
-        node_Mix.inputs['Fac'].default_value = noise_mix_value[0]
+        node_Mix.inputs['Fac'].default_value = noise_mix_value
 
 
-    def __white_balance_randomize(self):
+    def __white_balance_randomize(self, enabled, value):
         """Randomizes the value of WhiteBalanceNode input-ColorTemperature, which adjust the color temperature."""
         default_white_balance_value = 6500
-        ## Set happen distribution
-        white_balance_happen_distribution = [self.white_balance_probability, 1 - self.white_balance_probability]
-        ## White balance randomize
-        white_balance_value_max = int(self.white_balance_value_range["max"])
-        white_balance_value_min = int(self.white_balance_value_range["min"])
-        random_white_balance_value = random.randrange(white_balance_value_min, white_balance_value_max + 1 ,1)
-        white_balance_value = random.choices([random_white_balance_value, default_white_balance_value],white_balance_happen_distribution)
+        white_balance_value = value if enabled else default_white_balance_value
         node_WhiteBalance = bpy.data.scenes['Scene'].node_tree.nodes["Wb"]
-        node_WhiteBalance.inputs['ColorTemperature'].default_value = white_balance_value[0]
+        node_WhiteBalance.inputs['ColorTemperature'].default_value = white_balance_value
 
 
-    def __brightness_randomize(self):
+    def __brightness_randomize(self, enabled, value):
         """Randomizes the value of Bright/Contrast nodes input-Bright, which adjust the brightness[16]."""
         default_brightness_value = 0
-        # Set happen distribution
-        brightness_happen_distribution = [self.brightness_probability, 1 - self.brightness_probability]
-        # Brightness randomize
-        brightness_value_max = int(self.brightness_value_range["max"])
-        brightness_value_min = int(self.brightness_value_range["min"])
-        random_brightness_value = random.randrange(brightness_value_min, brightness_value_max + 1 ,1)
-        brightness_value = random.choices([random_brightness_value, default_brightness_value],brightness_happen_distribution)
+        brightness_value = value if enabled else default_brightness_value
         node_BrightContrast = bpy.data.scenes['Scene'].node_tree.nodes["Bright/Contrast"]
-        node_BrightContrast.inputs["Bright"].default_value = brightness_value[0]
+        node_BrightContrast.inputs["Bright"].default_value = brightness_value
 
 
-    def __contrast_randomize(self):
+    def __contrast_randomize(self, enabled, value):
         """Randomizes the value of Bright/Contrast nodes input-Contrast, which adjust the contrast[16]."""  
         default_contrast_value = 0
-        # Set happen distribution
-        contrast_happen_distribution = [self.contrast_probability, 1 - self.contrast_probability]
-        # Contrast randomize
-        contrast_value_max = int(self.contrast_value_range["max"])
-        contrast_value_min = int(self.contrast_value_range["min"])
-        random_contrast_value = random.randrange(contrast_value_min, contrast_value_max + 1 ,1)
-        contrast_value = random.choices([random_contrast_value, default_contrast_value], contrast_happen_distribution)
+        contrast_value = value if enabled else default_contrast_value
         node_BrightContrast = bpy.data.scenes['Scene'].node_tree.nodes["Bright/Contrast"]
-        node_BrightContrast.inputs["Contrast"].default_value = contrast_value[0]
+        node_BrightContrast.inputs["Contrast"].default_value = contrast_value
 
 
-    def __hue_randomize(self):
+    def __hue_randomize(self, enabled, value):
         """Randomizes the value of Hue Saturation Value nodes input-Hue, which adjust the hue[17]."""
         default_hue_value = 0.5
-        # Set happen distribution
-        hue_happen_distribution = [self.hue_probability, 1 - self.hue_probability]
-        # Hue randomize
-        hue_value_max = int(self.hue_value_range["max"] * 1000)
-        hue_value_min = int(self.hue_value_range["min"] * 1000)
-        random_hue_value = random.randrange(hue_value_min, hue_value_max + 1 ,1) / 1000
-        hue_value = random.choices([random_hue_value, default_hue_value], hue_happen_distribution)
+        hue_value = value if enabled else default_hue_value
         node_HueSaturationValue = bpy.data.scenes['Scene'].node_tree.nodes["Hue Saturation Value"]
-        node_HueSaturationValue.inputs['Hue'].default_value = hue_value[0]
+        node_HueSaturationValue.inputs['Hue'].default_value = hue_value
 
 
-    def __saturation_randomize(self):
+    def __saturation_randomize(self, enabled, value):
         """Randomizes the value of Hue Saturation Value nodes input-Saturation, which adjust the saturation[17]."""
         default_saturation_value = 1
-        # Set happen distribution
-        saturation_happen_distribution = [self.saturation_probability, 1 - self.saturation_probability]
-        # Saturation randomize
-        saturation_value_max = int(self.saturation_value_range["max"] * 1000)
-        saturation_value_min = int(self.saturation_value_range["min"] * 1000)
-        random_saturation_value = random.randrange(saturation_value_min, saturation_value_max + 1 ,1) / 1000
-        saturation_value = random.choices([random_saturation_value, default_saturation_value], saturation_happen_distribution)
+        saturation_value = value if enabled else default_saturation_value
         node_HueSaturationValue = bpy.data.scenes['Scene'].node_tree.nodes["Hue Saturation Value"]
-        node_HueSaturationValue.inputs['Saturation'].default_value = saturation_value[0]
+        node_HueSaturationValue.inputs['Saturation'].default_value = saturation_value
  
 
     def camera_randomize(self):
@@ -485,16 +431,21 @@ class CameraRandomizer:
         self.__set_camera()
         self.__create_wb_node_group()
         self.__create_compositing_nodes()
-        self.__chromatic_aberration_randomize()
-        self.__blur_randomize()
-        self.__motion_blur_randomize()
-        self.__exposure_randomize()
-        self.__noise_randomize()
-        self.__white_balance_randomize()
-        self.__brightness_randomize()
-        self.__contrast_randomize()
-        self.__hue_randomize()
-        self.__saturation_randomize()
+        # Draw every effect at once, the columns follow AUGMENTATION_NAMES, packed on every call so attribute changes apply
+        probabilities, value_ranges = pack_augmentations(self)
+        enabled, values = sample_augmentations(probabilities, value_ranges, 1, self.__rng)
+        effect_randomize_list = [self.__chromatic_aberration_randomize,
+                                 self.__blur_randomize,
+                                 self.__motion_blur_randomize,
+                                 self.__exposure_randomize,
+                                 self.__noise_randomize,
+                                 self.__white_balance_randomize,
+                                 self.__brightness_randomize,
+                                 self.__contrast_randomize,
+                                 self.__hue_randomize,
+                                 self.__saturation_randomize]
+        for i, effect_randomize in enumerate(effect_randomize_list):
+            effect_randomize(bool(enabled[0, i]), float(values[0, i]))
 
         print("Camera Randomize COMPLERED !!!")
 
@@ -1,29 +1,49 @@
+import math
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Tuple
+from util.cachedGlob import cached_glob
+from util.valueRange import Range
+
+
+def _env_path(env_name: str, default: str):
+    """A path field defaulting to the env_name environment variable, or to default when it is not set."""
+    return field(default_factory = lambda: Path(os.environ.get(env_name, default)))
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
 class HumanSDGParameter:
     """ A configuration class to configure this blender-based synthetic data generator pipeline.
+    It is immutable and hashable, override the defaults by keyword, e.g. HumanSDGParameter(gen_num = 100).
+    The paths can also be set with the HUMANSDG_* environment variables, '~' and $VARS in them are expanded once.
+    Requires Python 3.10 or later (slots and kw_only dataclass). HumanSDGLooper imports this module in the system
+    Python, so it only uses the standard library at import time, numpy is imported when sampling.
 
     Attributes
     ----------
     gen_num (int): The quantity of synthetic images needed to be generated.
-    blender_exe_path (str): The path to the blender executable[1].
-    asset_background_object_folder_path (str): The path to background object assets.
-    asset_foreground_object_folder_path (str): The path to foreground object assets.
-    asset_occluder_folder_path (str): The path to occlusion object assets.
-    asset_ambientCGMaterial_folder_path (str): The path to the downloaded ambientCG PBR materials.
-    asset_hdri_lighting_folder_path (str): The path to the downloaded Poly Haven HDRIs.
-    asset_animation_folder_path (str): The path to the animation assets directory.
-    output_img_path (str): The path where rendered images will be saved.
-    output_annotation_path (str): The path where MSCOCO format bounding box and skeleton keypoints annotations will be saved.
+    seed (int): The master seed of the random generators, each scene is reproducible from seed and its index given the same asset folders. None for non-reproducible scenes.
+    blender_exe_path (Path): The path to the blender executable[1]. Env HUMANSDG_BLENDER_EXE.
+    asset_background_object_folder_path (Path): The path to background object assets. Env HUMANSDG_BG_OBJ.
+    asset_foreground_object_folder_path (Path): The path to foreground object assets. Env HUMANSDG_FG_OBJ.
+    asset_occluder_folder_path (Path): The path to occlusion object assets. Env HUMANSDG_OCCLUDER.
+    asset_ambientCGMaterial_folder_path (Path): The path to the downloaded ambientCG PBR materials. Env HUMANSDG_AMBIENTCG.
+    asset_hdri_lighting_folder_path (Path): The path to the downloaded Poly Haven HDRIs. Env HUMANSDG_HDRI.
+    asset_animation_folder_path (Path): The path to the animation assets directory. Env HUMANSDG_ANIMATION.
+    output_img_path (Path): The path where rendered images will be saved. Env HUMANSDG_OUTPUT_IMG.
+    output_annotation_path (Path): The path where MSCOCO format bounding box and skeleton keypoints annotations will be saved. Env HUMANSDG_OUTPUT_ANNOTATION.
     background_poisson_disk_sampling_radius (float): Background objects separation distance.
-    num_foreground_object_in_scene_range (dict of str: int): The distribution of the number of virtual humans within the blender scene.
-    foreground_area (list of float): Spatial distribution area of foreground objects.
+    num_foreground_object_in_scene_range (Range of int): The distribution of the number of virtual humans within the blender scene.
+    foreground_area (tuple of float): Spatial distribution area of foreground objects.
     foreground_poisson_disk_sampling_radius (float): Foreground objects separation distance.
-    num_occluder_in_scene_range (dict of str: int): The distribution of the number of occlusion objects within the blender scene.
-    occluder_area (list of float): Spatial distribution area of occlusion objects.
+    num_occluder_in_scene_range (Range of int): The distribution of the number of occlusion objects within the blender scene.
+    occluder_area (tuple of float): Spatial distribution area of occlusion objects.
     occluder_poisson_disk_sampling_radius (float): Occlusion objects separation distance.
-    bg_obj_scale_ratio_range (dict of str: float): The distribution of the scale ratio of background objects within the blender scene.
-    fg_obj_scale_ratio_range (dict of str: float): The distribution of the scale ratio of foreground objects within the blender scene.
-    occluder_scale_ratio_range (dict of str: float): The distribution of the scale ratio of occluder objects within the blender scene.
-    hdri_lighting_strength_range (dict of str: float): The distribution of the strength factor for the intensity of the HDRI scene light.
+    bg_obj_scale_ratio_range (Range of float): The distribution of the scale ratio of background objects within the blender scene.
+    fg_obj_scale_ratio_range (Range of float): The distribution of the scale ratio of foreground objects within the blender scene.
+    occluder_scale_ratio_range (Range of float): The distribution of the scale ratio of occluder objects within the blender scene.
+    hdri_lighting_strength_range (Range of float): The distribution of the strength factor for the intensity of the HDRI scene light.
     camera_focal_length (int): Perspective Camera focal length value in millimeters.
     img_resolution_x (int): Number of horizontal pixels in the rendered image.
     img_resolution_y (int): Number of vertical pixels in the rendered image.
@@ -38,66 +58,136 @@ class HumanSDGParameter:
     contrast_probability (float): Probability of contrast adjustment being enabled.
     hue_probability (float): Probability of hue adjustment being enabled.
     saturation_probability (float): Probability of saturation adjustment being enabled.
-    chromatic_aberration_value_range (dict of str: float): The distribution of the value of Lens Distortion nodes input-Dispersion, which simulates chromatic aberration.
-    blur_value_range (dict of str: float): The distribution of the value of Blur nodes input-Size, which controls the blur radius values.
-    motion_blur_value_range (dict of str: float): The distribution of the value of Vector Blur nodes input-Speed, which controls the direction of motion.
-    exposure_value_range (dict of str: float): The distribution of the value of Exposure nodes input-Exposure, which controls the scalar factor to adjust the exposure.
-    noise_value_range (dict of str: float): The distribution of the value of brightness of the noise texture.
-    white_balance_value_range (dict of str: float): The distribution of the value of WhiteBalanceNode input-ColorTemperature, which adjust the color temperature.
-    brightness_value_range (dict of str: float): The distribution of the value of Bright/Contrast nodes input-Bright, which adjust the brightness.
-    contrast_value_range (dict of str: float): The distribution of the value of Bright/Contrast nodes input-Contrast, which adjust the contrast.
-    hue_value_range (dict of str: float): The distribution of the value of Hue Saturation Value nodes input-Hue, which adjust the hue.
-    saturation_value_range (dict of str: float): The distribution of the value of Hue Saturation Value nodes input-Saturation, which adjust the saturation.
+    chromatic_aberration_value_range (Range of float): The distribution of the value of Lens Distortion nodes input-Dispersion, which simulates chromatic aberration.
+    blur_value_range (Range of float): The distribution of the value of Blur nodes input-Size, which controls the blur radius values.
+    motion_blur_value_range (Range of float): The distribution of the value of Vector Blur nodes input-Speed, which controls the direction of motion.
+    exposure_value_range (Range of float): The distribution of the value of Exposure nodes input-Exposure, which controls the scalar factor to adjust the exposure.
+    noise_value_range (Range of float): The distribution of the value of brightness of the noise texture.
+    white_balance_value_range (Range of float): The distribution of the value of WhiteBalanceNode input-ColorTemperature, which adjust the color temperature.
+    brightness_value_range (Range of float): The distribution of the value of Bright/Contrast nodes input-Bright, which adjust the brightness.
+    contrast_value_range (Range of float): The distribution of the value of Bright/Contrast nodes input-Contrast, which adjust the contrast.
+    hue_value_range (Range of float): The distribution of the value of Hue Saturation Value nodes input-Hue, which adjust the hue.
+    saturation_value_range (Range of float): The distribution of the value of Hue Saturation Value nodes input-Saturation, which adjust the saturation.
+    background_poisson_disk_cell_size (float): Side of the Bridson background grid cell on the 2d background plane, derived.
+    foreground_poisson_disk_cell_size (float): Side of the Bridson background grid cell on the foreground area, derived.
+    occluder_poisson_disk_cell_size (float): Side of the Bridson background grid cell on the occluder area, derived.
+
+    Methods
+    -------
+    background_object_files(): The .blend files in asset_background_object_folder_path.
+    foreground_object_files(): The .blend files in asset_foreground_object_folder_path.
+    occluder_files(): The .blend files in asset_occluder_folder_path.
+    hdri_lighting_files(): The .exr files in asset_hdri_lighting_folder_path.
+    animation_files(): The .blend files in asset_animation_folder_path.
+    sample_augmentations(): Draw the enabled camera effects and their values for a batch of images.
 
     References
     ----------
     [1]https://docs.blender.org/manual/en/latest/advanced/blender_directory_layout.html
 
     """
-    
-    def __init__(self):
-        self.gen_num = 400
-        self.blender_exe_path = "C:/program Files/Blender Foundation/Blender 3.3/blender"
-        self.asset_background_object_folder_path = 'C:/Users/user/Documents/project/synthDet/Asset/background_object'
-        self.asset_foreground_object_folder_path = "F:/ProceduralHuman1500"
-        self.asset_occluder_folder_path = "C:/Users/user/Documents/project/synthDet/Asset/occluder"
-        self.asset_ambientCGMaterial_folder_path = "C:/Users/user/Documents/project/synthDet/Asset/blenderproc_asset/cc_texture"
-        self.asset_hdri_lighting_folder_path = "C:/Users/user/Documents/project/synthDet/Asset/Lighting/HDRI"
-        self.asset_animation_folder_path = "C:/Users/user/Documents/project/PeopleSansPeople/Asset/Animation/WIP/Frame250"
-        self.output_img_path = "F:/PeopleSansPeople_synth40000/images"
-        self.output_annotation_path = "F:/PeopleSansPeople_synth40000/annotations_single"
-        self.background_poisson_disk_sampling_radius = 0.5
-        self.num_foreground_object_in_scene_range = {"min": 1, "max": 6}
-        self.foreground_area = [9, 7, 4]
-        self.foreground_poisson_disk_sampling_radius = 1.5
-        self.num_occluder_in_scene_range = {"min": 5 , "max": 10}
-        self.occluder_area = [2.5, 1.5, 0.5]
-        self.occluder_poisson_disk_sampling_radius =  0.25
-        self.bg_obj_scale_ratio_range = {"min": 6, "max": 6}
-        self.fg_obj_scale_ratio_range = {"min": 0.8, "max": 1.5}
-        self.occluder_scale_ratio_range = {"min": 0.5, "max": 1.2}
-        self.hdri_lighting_strength_range = {"min": 0.1 , "max": 2}
-        self.camera_focal_length = 35
-        self.img_resolution_x = 640
-        self.img_resolution_y = 480
-        self.max_samples = 256
-        self.chromatic_aberration_probability = 0.1
-        self.blur_probability = 0.1
-        self.motion_blur_probability = 0.1 
-        self.exposure_probability = 0.15
-        self.noise_probability = 0.1
-        self.white_balance_probability = 0.15
-        self.brightness_probability = 0.15
-        self.contrast_probability = 0.15
-        self.hue_probability = 0.15
-        self.saturation_probability = 0.15
-        self.chromatic_aberration_value_range = {"min": 0.1, "max": 1}
-        self.blur_value_range = {"min": 2, "max": 4}
-        self.motion_blur_value_range = {"min": 2, "max": 7}
-        self.exposure_value_range = {"min": -0.5, "max": 2}
-        self.noise_value_range = {"min": 1.6, "max": 1.8}
-        self.white_balance_value_range = {"min": 3500, "max": 9500}
-        self.brightness_value_range = {"min": -1, "max": 1}
-        self.contrast_value_range = {"min": -1, "max": 5}
-        self.hue_value_range =  {"min": 0.45, "max": 0.55}
-        self.saturation_value_range = {"min": 0.75, "max": 1.25}
\ No newline at end of file
+
+    gen_num: int = 400
+    seed: Optional[int] = None
+    blender_exe_path: Path = _env_path("HUMANSDG_BLENDER_EXE", "C:/program Files/Blender Foundation/Blender 3.3/blender")
+    asset_background_object_folder_path: Path = _env_path("HUMANSDG_BG_OBJ", "C:/Users/user/Documents/project/synthDet/Asset/background_object")
+    asset_foreground_object_folder_path: Path = _env_path("HUMANSDG_FG_OBJ", "F:/ProceduralHuman1500")
+    asset_occluder_folder_path: Path = _env_path("HUMANSDG_OCCLUDER", "C:/Users/user/Documents/project/synthDet/Asset/occluder")
+    asset_ambientCGMaterial_folder_path: Path = _env_path("HUMANSDG_AMBIENTCG", "C:/Users/user/Documents/project/synthDet/Asset/blenderproc_asset/cc_texture")
+    asset_hdri_lighting_folder_path: Path = _env_path("HUMANSDG_HDRI", "C:/Users/user/Documents/project/synthDet/Asset/Lighting/HDRI")
+    asset_animation_folder_path: Path = _env_path("HUMANSDG_ANIMATION", "C:/Users/user/Documents/project/PeopleSansPeople/Asset/Animation/WIP/Frame250")
+    output_img_path: Path = _env_path("HUMANSDG_OUTPUT_IMG", "F:/PeopleSansPeople_synth40000/images")
+    output_annotation_path: Path = _env_path("HUMANSDG_OUTPUT_ANNOTATION", "F:/PeopleSansPeople_synth40000/annotations_single")
+    background_poisson_disk_sampling_radius: float = 0.5
+    num_foreground_object_in_scene_range: Range = Range(1, 6)
+    foreground_area: Tuple[float, ...] = (9, 7, 4)
+    foreground_poisson_disk_sampling_radius: float = 1.5
+    num_occluder_in_scene_range: Range = Range(5, 10)
+    occluder_area: Tuple[float, ...] = (2.5, 1.5, 0.5)
+    occluder_poisson_disk_sampling_radius: float = 0.25
+    bg_obj_scale_ratio_range: Range = Range(6, 6)
+    fg_obj_scale_ratio_range: Range = Range(0.8, 1.5)
+    occluder_scale_ratio_range: Range = Range(0.5, 1.2)
+    hdri_lighting_strength_range: Range = Range(0.1, 2)
+    camera_focal_length: int = 35
+    img_resolution_x: int = 640
+    img_resolution_y: int = 480
+    max_samples: int = 256
+    chromatic_aberration_probability: float = 0.1
+    blur_probability: float = 0.1
+    motion_blur_probability: float = 0.1
+    exposure_probability: float = 0.15
+    noise_probability: float = 0.1
+    white_balance_probability: float = 0.15
+    brightness_probability: float = 0.15
+    contrast_probability: float = 0.15
+    hue_probability: float = 0.15
+    saturation_probability: float = 0.15
+    chromatic_aberration_value_range: Range = Range(0.1, 1)
+    blur_value_range: Range = Range(2, 4)
+    motion_blur_value_range: Range = Range(2, 7)
+    exposure_value_range: Range = Range(-0.5, 2)
+    noise_value_range: Range = Range(1.6, 1.8)
+    white_balance_value_range: Range = Range(3500, 9500)
+    brightness_value_range: Range = Range(-1, 1)
+    contrast_value_range: Range = Range(-1, 5)
+    hue_value_range: Range = Range(0.45, 0.55)
+    saturation_value_range: Range = Range(0.75, 1.25)
+    background_poisson_disk_cell_size: float = field(init=False)
+    foreground_poisson_disk_cell_size: float = field(init=False)
+    occluder_poisson_disk_cell_size: float = field(init=False)
+    # Arrays are neither hashable nor comparable with ==, keep them out of __eq__ and __hash__
+
+    _path_field_names = ("blender_exe_path",
+                         "asset_background_object_folder_path",
+                         "asset_foreground_object_folder_path",
+                         "asset_occluder_folder_path",
+                         "asset_ambientCGMaterial_folder_path",
+                         "asset_hdri_lighting_folder_path",
+                         "asset_animation_folder_path",
+                         "output_img_path",
+                         "output_annotation_path")
+    _range_field_names = tuple(name for name, annotation in __annotations__.items() if annotation is Range)
+
+    def __post_init__(self):
+        """Normalize the paths, areas and ranges, then derive the poisson disk grid cell sizes once."""
+        for name in self._path_field_names:
+            # Keyword overrides may be str, expand '~' and $VARS a single time here instead of at every use
+            path = os.path.expandvars(os.path.expanduser(os.fspath(getattr(self, name))))
+            object.__setattr__(self, name, Path(path))
+        # Keyword overrides may be lists or (min, max) pairs, coerce them so the instance stays hashable
+        for name in ("foreground_area", "occluder_area"):
+            object.__setattr__(self, name, tuple(getattr(self, name)))
+        for name in self._range_field_names:
+            object.__setattr__(self, name, Range(*getattr(self, name)))
+        # The dataclass is frozen, derived fields have to bypass its __setattr__
+        # A cell of side radius/sqrt(dimension) holds at most one sample, the background is sampled on a plane
+        object.__setattr__(self, "background_poisson_disk_cell_size", self.background_poisson_disk_sampling_radius / math.sqrt(2))
+        object.__setattr__(self, "foreground_poisson_disk_cell_size", self.foreground_poisson_disk_sampling_radius / math.sqrt(len(self.foreground_area)))
+        object.__setattr__(self, "occluder_poisson_disk_cell_size", self.occluder_poisson_disk_sampling_radius / math.sqrt(len(self.occluder_area)))
+
+    def background_object_files(self) -> Tuple[str, ...]:
+        """The .blend files of background objects, the folder is listed once per process until it changes."""
+        return tuple(cached_glob(self.asset_background_object_folder_path, "*.blend"))
+
+    def foreground_object_files(self) -> Tuple[str, ...]:
+        """The .blend files of foreground objects, the folder is listed once per process until it changes."""
+        return tuple(cached_glob(self.asset_foreground_object_folder_path, "*.blend"))
+
+    def occluder_files(self) -> Tuple[str, ...]:
+        """The .blend files of occluders, the folder is listed once per process until it changes."""
+        return tuple(cached_glob(self.asset_occluder_folder_path, "*.blend"))
+
+    def hdri_lighting_files(self) -> Tuple[str, ...]:
+        """The .exr HDRIs, the folder is listed once per process until it changes."""
+        return tuple(cached_glob(self.asset_hdri_lighting_folder_path, "*.exr"))
+
+    def animation_files(self) -> Tuple[str, ...]:
+        """The .blend files of animations, the folder is listed once per process until it changes."""
+        return tuple(cached_glob(self.asset_animation_folder_path, "*.blend"))
+
+    def sample_augmentations(self, n: int, rng):
+        """Returns an (n, 10) boolean mask of the enabled camera effects and an (n, 10) array of their values, columns follow AUGMENTATION_NAMES."""
+        # Imported here so the Looper can load the configuration without numpy
+        from util.augmentationSampling import pack_augmentations, sample_augmentations
+        return sample_augmentations(*pack_augmentations(self), n, rng)
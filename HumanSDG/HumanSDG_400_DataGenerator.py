@@ -11,6 +11,7 @@ if module_path not in sys_path_list:
 sys.dont_write_bytecode = True
 
 import bpy 
+import traceback
 from HumanSDG_000_Initializer import Initializer
 from HumanSDG_010_BackgroundObjectPlacementRandomizer import BackgroundObjectPlacementRandomizer
 from HumanSDG_020_ForegroundObjectPalcementRandomizer import ForegroundObjectPlacementRandomizer
@@ -24,10 +25,25 @@ from HumanSDG_090_AnimationRandomizer import AnimationRandomizer
 from HumanSDG_100_CameraRandomizer import CameraRandomizer
 from HumanSDG_200_MSCOCOLabeler_IDMask import MSCOCOLabeler
 from HumanSDG_300_HumanSDGParameter import HumanSDGParameter
+from util.randomGenerator import make_rngs
 
 
 class DataGenerator:
     
+    def __get_scene_index(self):
+        """Get the scene index passed by the Looper after "--" in the blender command line, 0 if missing.
+
+        References
+        ----------
+        https://docs.blender.org/manual/en/latest/advanced/command_line/arguments.html
+
+        """
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+        if "--scene-index" in argv:
+            return int(argv[argv.index("--scene-index") + 1])
+        return 0
+
+
     def gen_one_data(self):
         """ 
         A class that instantiates all components of the Synthetic Data Generation (SDG) process, updates instance attributes, 
@@ -35,6 +51,7 @@ class DataGenerator:
 
         Methods
         -------
+        __get_scene_index(): Get the scene index passed by the Looper.
         gen_one_data(): Generates one synthetic data.
 
         References
@@ -50,36 +67,45 @@ class DataGenerator:
         initializer.img_resolution_x = parameter.img_resolution_x
         initializer.img_resolution_y = parameter.img_resolution_y
         initializer.init()
-        background_object_placement_randomizer = BackgroundObjectPlacementRandomizer()
-        foreground_object_placement_randomizer = ForegroundObjectPlacementRandomizer()
-        occluder_placement_randomizer = OccluderPlacementRandomizer()
-        object_scale_randomizer = ObjectScaleRandomizer()
-        texture_randomizer = TextureRandomizer()
-        bg_occ_rotation_randomizer = RotationRandomizer()
-        human_rotation_randomizer = HumanRotationRandomizer()
-        light_randomizer = LightRandomizer()
-        animation_randomizer = AnimationRandomizer()
-        camera_randomizer = CameraRandomizer()
+        # Spawn every randomizer generator from one SeedSequence, for reproducible scenes
+        rngs = make_rngs(seed = parameter.seed, scene_index = self.__get_scene_index())
+        background_object_placement_randomizer = BackgroundObjectPlacementRandomizer(seed = rngs["background_object_placement"])
+        foreground_object_placement_randomizer = ForegroundObjectPlacementRandomizer(seed = rngs["foreground_object_placement"])
+        occluder_placement_randomizer = OccluderPlacementRandomizer(seed = rngs["occluder_placement"])
+        object_scale_randomizer = ObjectScaleRandomizer(seed = rngs["object_scale"])
+        texture_randomizer = TextureRandomizer(seed = rngs["texture"])
+        bg_occ_rotation_randomizer = RotationRandomizer(seed = rngs["rotation"])
+        human_rotation_randomizer = HumanRotationRandomizer(seed = rngs["human_rotation"])
+        light_randomizer = LightRandomizer(seed = rngs["light"])
+        animation_randomizer = AnimationRandomizer(seed = rngs["animation"])
+        camera_randomizer = CameraRandomizer(seed = rngs["camera"])
         mscoco_annotation_labeler = MSCOCOLabeler()
 
         print("Component Initialize Completed!!!")
 
         # Passing params
         background_object_placement_randomizer.background_poisson_disk_sampling_radius = parameter.background_poisson_disk_sampling_radius
+        background_object_placement_randomizer.background_poisson_disk_cell_size = parameter.background_poisson_disk_cell_size
         background_object_placement_randomizer.asset_background_object_folder_path = parameter.asset_background_object_folder_path
+        background_object_placement_randomizer.asset_background_object_path_list = parameter.background_object_files()
         foreground_object_placement_randomizer.num_foreground_object_in_scene_range = parameter.num_foreground_object_in_scene_range
         foreground_object_placement_randomizer.foreground_area = parameter.foreground_area
         foreground_object_placement_randomizer.foreground_poisson_disk_sampling_radius = parameter.foreground_poisson_disk_sampling_radius
+        foreground_object_placement_randomizer.foreground_poisson_disk_cell_size = parameter.foreground_poisson_disk_cell_size
         foreground_object_placement_randomizer.asset_foreground_object_folder_path = parameter.asset_foreground_object_folder_path
+        foreground_object_placement_randomizer.asset_foreground_object_path_list = parameter.foreground_object_files()
         occluder_placement_randomizer.num_occluder_in_scene_range = parameter.num_occluder_in_scene_range
         occluder_placement_randomizer.occluder_area = parameter.occluder_area
         occluder_placement_randomizer.occluder_poisson_disk_sampling_radius = parameter.occluder_poisson_disk_sampling_radius
+        occluder_placement_randomizer.occluder_poisson_disk_cell_size = parameter.occluder_poisson_disk_cell_size
         occluder_placement_randomizer.asset_occluder_folder_path = parameter.asset_occluder_folder_path
+        occluder_placement_randomizer.asset_occluder_path_list = parameter.occluder_files()
         object_scale_randomizer.bg_obj_scale_ratio_range = parameter.bg_obj_scale_ratio_range
         object_scale_randomizer.fg_obj_scale_ratio_range = parameter.fg_obj_scale_ratio_range
         object_scale_randomizer.occluder_scale_ratio_range = parameter.occluder_scale_ratio_range
         texture_randomizer.asset_ambientCGMaterial_folder_path = parameter.asset_ambientCGMaterial_folder_path
         light_randomizer.asset_hdri_lighting_folder_path = parameter.asset_hdri_lighting_folder_path
+        light_randomizer.asset_hdri_lighting_path_list = parameter.hdri_lighting_files()
         light_randomizer.hdri_lighting_strength_range = parameter.hdri_lighting_strength_range
         camera_randomizer.max_samples = parameter.max_samples
         camera_randomizer.chromatic_aberration_probability = parameter.chromatic_aberration_probability
@@ -103,6 +129,7 @@ class DataGenerator:
         camera_randomizer.saturation_probability = parameter.saturation_probability
         camera_randomizer.saturation_value_range = parameter.saturation_value_range
         animation_randomizer.asset_animation_folder_path = parameter.asset_animation_folder_path
+        animation_randomizer.asset_animation_path_list = parameter.animation_files()
         mscoco_annotation_labeler.output_img_path = parameter.output_img_path
         mscoco_annotation_labeler.output_annotation_path = parameter.output_annotation_path
 
@@ -126,4 +153,9 @@ class DataGenerator:
 
 if __name__ == '__main__':
     datagen = DataGenerator()
-    datagen.gen_one_data()
\ No newline at end of file
+    try:
+        datagen.gen_one_data()
+    except Exception:
+        # Log the error and quit blender with a failure code instead of leaving it open, the Looper skips this scene
+        traceback.print_exc()
+        sys.exit(1)
\ No newline at end of file
@@ -4,14 +4,17 @@ https://gist.github.com/andrewbolster/10274979
 
 import numpy as np 
 
-def random_three_vector():
+def random_three_vector(rng = None):
     """
     Generates a random 3D unit vector (direction) with a uniform spherical distribution
     Algo from http://stackoverflow.com/questions/5408276/python-uniform-spherical-distribution
+    :param rng: numpy.random.Generator to draw from, numpy's global random state if None
     :return:
     """
-    phi = np.random.uniform(0,np.pi*2)
-    costheta = np.random.uniform(-1,1)
+    if rng is None:
+        rng = np.random
+    phi = rng.uniform(0,np.pi*2)
+    costheta = rng.uniform(-1,1)
 
     theta = np.arccos( costheta )
     x = np.sin( theta) * np.cos( phi )
@@ -0,0 +1,83 @@
+from typing import Tuple
+import numpy as np
+
+# Order of the columns of the sampled augmentation arrays
+AUGMENTATION_NAMES = ("chromatic_aberration",
+                      "blur",
+                      "motion_blur",
+                      "exposure",
+                      "noise",
+                      "white_balance",
+                      "brightness",
+                      "contrast",
+                      "hue",
+                      "saturation")
+
+
+def pack_augmentations(source) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Packs the <name>_probability and <name>_value_range attributes of source into arrays, rows follow
+    AUGMENTATION_NAMES.
+
+        Parameters
+        ----------
+        source : object
+            Any object with a <name>_probability and a <name>_value_range attribute for every name, such as
+            HumanSDGParameter or CameraRandomizer.
+
+        Returns
+        -------
+        probabilities : ndarray
+            A (10,) float32 array of the probabilities.
+
+        value_ranges : ndarray
+            A (10, 2) float32 array of the [min, max] ranges.
+    """
+    probabilities = np.array([getattr(source, f"{name}_probability") for name in AUGMENTATION_NAMES], dtype=np.float32)
+    value_ranges = np.array([getattr(source, f"{name}_value_range") for name in AUGMENTATION_NAMES], dtype=np.float32)
+    return probabilities, value_ranges
+
+
+def sample_augmentations(probabilities: np.ndarray,
+                         value_ranges: np.ndarray,
+                         n: int,
+                         rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Draws which camera effects are enabled and their values for n images at once, with one random call for the
+    masks and one for the values.
+
+        Parameters
+        ----------
+        probabilities : ndarray
+            A (k,) array, the probability of each effect being enabled.
+
+        value_ranges : ndarray
+            A (k, 2) array, the [min, max] range of the value of each effect.
+
+        n : int
+            The number of images.
+
+        rng : numpy.random.Generator
+            The random generator to draw from.
+
+        Returns
+        -------
+        enabled : ndarray
+            An (n, k) boolean array, True where the effect is enabled.
+
+        values : ndarray
+            An (n, k) array of values drawn uniformly from the ranges, drawn for every effect even when disabled.
+            The blur column holds integers drawn uniformly from [min, max], both ends included.
+    """
+    k = probabilities.shape[0]
+    enabled = rng.random((n, k)) < probabilities
+    low = value_ranges[:, 0]
+    high = value_ranges[:, 1]
+    u = rng.random((n, k))
+    values = low + u * (high - low)
+    # Blur size is an integer, map the same uniform draw onto min, ..., max with equal weights
+    blur_index = AUGMENTATION_NAMES.index("blur")
+    if blur_index < k:
+        blur_min, blur_max = value_ranges[blur_index]
+        values[:, blur_index] = np.minimum(np.floor(blur_min + u[:, blur_index] * (blur_max - blur_min + 1)), blur_max)
+    return enabled, values
@@ -0,0 +1,67 @@
+import glob
+import os
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+# Data format : {(folder_path, pattern): (folder_mtime_ns, [path1, path2, ...])}
+_glob_cache: Dict[Tuple[Union[str, os.PathLike], str], Tuple[int, List[str]]] = {}
+
+
+def cached_glob(folder_path: Union[str, os.PathLike], pattern: str) -> List[str]:
+    """
+    Returns the paths in folder_path matching pattern, the folder is only listed again when its modification
+    time changes (a file is added, removed or renamed in it).
+
+        Parameters
+        ----------
+        folder_path : str or PathLike
+            The folder to list.
+
+        pattern : str
+            The glob pattern of the file names, for example "*.blend".
+
+        Returns
+        -------
+        paths : List[str]
+            A new sorted list of the matching paths, callers may shuffle or modify it.
+    """
+    try:
+        folder_mtime = os.stat(folder_path).st_mtime_ns
+    except OSError:
+        # Missing folder, let the caller report the empty asset list
+        return []
+
+    key = (folder_path, pattern)
+    cached = _glob_cache.get(key)
+    if cached is None or cached[0] != folder_mtime:
+        # Sorted, glob order depends on the file system and would break reproducible scenes
+        cached = (folder_mtime, sorted(glob.glob(os.path.join(folder_path, pattern))))
+        _glob_cache[key] = cached
+    return list(cached[1])
+
+
+def asset_path_list(path_list: Optional[Sequence[str]],
+                    folder_path: Union[str, os.PathLike],
+                    pattern: str) -> List[str]:
+    """
+    Returns the asset paths a randomizer works on, the given listing when the DataGenerator passed the one of
+    HumanSDGParameter, otherwise the cached listing of folder_path when the randomizer is used standalone.
+
+        Parameters
+        ----------
+        path_list : Sequence[str] or None
+            The prebuilt listing, None to list folder_path.
+
+        folder_path : str or PathLike
+            The folder to list when path_list is None.
+
+        pattern : str
+            The glob pattern of the file names, for example "*.blend".
+
+        Returns
+        -------
+        paths : List[str]
+            A new list of the paths, callers may shuffle or modify it.
+    """
+    if path_list is not None:
+        return list(path_list)
+    return cached_glob(folder_path, pattern)
@@ -0,0 +1,56 @@
+import bpy
+import numpy as np
+
+
+def points_in_camera_view(scene, camera, points, clip_start, clip_end):
+    """
+    Returns which points are inside the view frustum of the camera, testing all points at once with a single
+    matrix product instead of one world_to_camera_view call per point.
+
+        Parameters
+        ----------
+        scene : bpy.types.Scene
+            The scene whose render resolution and pixel aspect define the camera projection.
+
+        camera : bpy.types.Object
+            The camera object, its matrix_world must be up to date.
+
+        points : ndarray
+            An (n, 3) array of world space coordinates.
+
+        clip_start : float
+            Camera near clipping distance.
+
+        clip_end : float
+            Camera far clipping distance.
+
+        Returns
+        -------
+        in_view : ndarray
+            An (n,) boolean array, True for the points inside the frustum.
+
+        References
+        ----------
+        https://blender.stackexchange.com/questions/284884/what-does-world-to-camera-view-depend-on
+    """
+    # Camera projection combined with world to camera space, computed once for all points
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    render = scene.render
+    projection_matrix = np.array(camera.calc_matrix_camera(depsgraph,
+                                                           x = render.resolution_x,
+                                                           y = render.resolution_y,
+                                                           scale_x = render.pixel_aspect_x,
+                                                           scale_y = render.pixel_aspect_y))
+    world_to_camera_matrix = np.array(camera.matrix_world.inverted())
+    # Rows 0-3 map world space to clip space, row 4 gives the depth in front of the camera
+    view_matrix = np.vstack((projection_matrix @ world_to_camera_matrix, -world_to_camera_matrix[2]))
+
+    # World space to ndc space, all points at once in homogeneous coordinates
+    points = np.asarray(points, dtype = np.float64)
+    co_view = np.hstack((points, np.ones((len(points), 1)))) @ view_matrix.T
+    co_ndc = (co_view[:, :2] / co_view[:, 3:4] + 1.0) / 2.0 # Map [-1, 1] to [0, 1] like world_to_camera_view
+    co_depth = co_view[:, 4]
+    # Check wether points are inside frustum
+    return ((0.0 < co_ndc[:, 0]) & (co_ndc[:, 0] < 1.0) &
+            (0.0 < co_ndc[:, 1]) & (co_ndc[:, 1] < 1.0) &
+            (clip_start < co_depth) & (co_depth < clip_end))
@@ -1,60 +1,184 @@
-import bpy
-from itertools import product
-from typing import List
+import math
 import numpy as np
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    # numba is optional, Blender's bundled python does not ship it. Without it the sampler runs as plain python,
+    # install it into that python to compile it, see the Requirements section of the README:
+    #   "<blender dir>/3.3/python/bin/python3.10" -m ensurepip
+    #   "<blender dir>/3.3/python/bin/python3.10" -m pip install numba
+    _NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda function: function
 
 Point = np.ndarray
 Shape = np.ndarray
-ListOfPoints = List[np.ndarray]
-NDimArray = np.ndarray
+ArrayOfPoints = np.ndarray
+
+
+@njit(cache=True)
+def _get_random_annulus_candidate(sample: Point, radius: float, candidate: Point):
+    """Write into candidate a random point at a distance in [radius, 2 * radius] from sample."""
+    dimension = sample.shape[0]
+    # Uniform direction on the n-sphere from a normalised gaussian vector
+    norm = 0.0
+    while norm == 0.0:
+        for i in range(dimension):
+            candidate[i] = np.random.standard_normal()
+        norm = 0.0
+        for i in range(dimension):
+            norm += candidate[i] * candidate[i]
+        norm = math.sqrt(norm)
+    length = radius * (1.0 + np.random.random())
+    for i in range(dimension):
+        candidate[i] = sample[i] + candidate[i] / norm * length
+
 
+@njit(cache=True)
+def _get_cell_index(sample: Point, cell_size: float, grid_shape: np.ndarray, cell_index: np.ndarray):
+    """Write into cell_index the background grid cell containing sample."""
+    for i in range(sample.shape[0]):
+        index = int(sample[i] / cell_size)
+        cell_index[i] = min(index, grid_shape[i] - 1)
+
+
+@njit(cache=True)
 def _is_sample_valid(sample: Point,
-                     sample_region_size: Shape,
-                     grid: NDimArray,
+                     sample_domain_size: Shape,
+                     grid: np.ndarray,
+                     grid_shape: np.ndarray,
+                     grid_strides: np.ndarray,
                      cell_size: float,
-                     radius: float,
-                     points: ListOfPoints) -> bool:
-    if any(sample < 0) or any(sample > sample_region_size):
-        return False
-
-    # sample's cell index in the grid
-    cell_index = (sample // cell_size).astype(int)
-
-    start = ((max(coordinate, 0)
-              for coordinate in cell_index - 2))
-    end = ((min(coordinate, length - 1)
-            for coordinate, length
-            in zip(cell_index + 2, grid.shape)))
-    ranges = [list(range(start_, end_ + 1))
-              for (start_, end_) in zip(start, end)]
-
-    for index in product(*ranges):
-        point_index = grid[index]
+                     cell_reach: int,
+                     radius_sq: float,
+                     points: ArrayOfPoints,
+                     cell_index: np.ndarray,
+                     neighbour_index: np.ndarray) -> bool:
+    """Check the sample lies inside the domain and no accepted point in the neighbouring cells is closer than sqrt(radius_sq)."""
+    dimension = sample.shape[0]
+    for i in range(dimension):
+        if sample[i] < 0.0 or sample[i] >= sample_domain_size[i]:
+            return False
+
+    _get_cell_index(sample, cell_size, grid_shape, cell_index)
+
+    # Walk every cell of the (2 * cell_reach + 1)^d neighbourhood, clipped to the grid
+    for i in range(dimension):
+        neighbour_index[i] = max(cell_index[i] - cell_reach, 0)
+    while True:
+        flat_index = 0
+        for i in range(dimension):
+            flat_index += neighbour_index[i] * grid_strides[i]
+        point_index = grid[flat_index]
         if point_index != -1:
-            distance = np.linalg.norm(sample - points[point_index])
-            if distance < radius:
+            distance_sq = 0.0
+            for i in range(dimension):
+                delta = sample[i] - points[point_index, i]
+                distance_sq += delta * delta
+            if distance_sq < radius_sq:
                 return False
-    return True
 
+        # Advance to the next neighbour cell
+        axis = 0
+        while axis < dimension:
+            if neighbour_index[axis] < min(cell_index[axis] + cell_reach, grid_shape[axis] - 1):
+                neighbour_index[axis] += 1
+                break
+            neighbour_index[axis] = max(cell_index[axis] - cell_reach, 0)
+            axis += 1
+        if axis == dimension:
+            return True
+
+
+@njit(cache=True)
+def _bridson_core(radius: float, radius_sq: float, cell_size: float, sample_domain_size: Shape,
+                  sample_rejection_threshold: int, seed: int, origin: Point) -> ArrayOfPoints:
+    """Bridson's algorithm on a flattened background grid, returns an (n, dimension) array of points offset by origin.
+
+    A negative seed keeps the current random state. Compiled, numba keeps its own random state, so it must be seeded
+    here. In plain python this seeds numpy's global random state, poisson_disc_sampling restores it afterwards.
+    """
+    if seed >= 0:
+        np.random.seed(seed)
+
+    dimension = sample_domain_size.shape[0]
 
-def _get_random_n_dim_vector(dimension: int, min_length: float, max_length: float) -> Point:
-    # need n-1 angles, all in range [0; PI] except the last one which is in range [0; 2*PI]
-    random_angles = np.random.rand(dimension - 1) * np.pi
-    random_angles[-1] *= 2
-    length = np.random.uniform(min_length, max_length)
-    vector = np.empty(dimension)
+    # A cell of side at most radius/sqrt(d) holds at most one point, the neighbourhood has to span radius
+    cell_reach = int(math.ceil(radius / cell_size - 1e-9))
+    grid_shape = np.empty(dimension, dtype=np.int64)
     for i in range(dimension):
-        x_i = length * np.product(np.sin(random_angles[:i]))
-        if i != dimension - 1:
-            x_i *= np.cos(random_angles[i])
-        vector[i] = x_i
+        grid_shape[i] = max(int(math.ceil(sample_domain_size[i] / cell_size)), 1)
+    grid_strides = np.empty(dimension, dtype=np.int64)
+    stride = 1
+    for i in range(dimension - 1, -1, -1):
+        grid_strides[i] = stride
+        stride *= grid_shape[i]
 
-    return vector
+    # Contains indexes of points in the 'points' array
+    grid = np.full(stride, -1, dtype=np.int32)
+    points = np.empty((64, dimension), dtype=np.float64)
+    active_points = np.empty(64, dtype=np.int64)
+    cell_index = np.empty(dimension, dtype=np.int64)
+    neighbour_index = np.empty(dimension, dtype=np.int64)
+    candidate = np.empty(dimension, dtype=np.float64)
 
+    # Initial sample is always accepted, so the result is never empty
+    for i in range(dimension):
+        points[0, i] = np.random.random() * sample_domain_size[i]
+    _get_cell_index(points[0], cell_size, grid_shape, cell_index)
+    flat_index = 0
+    for i in range(dimension):
+        flat_index += cell_index[i] * grid_strides[i]
+    grid[flat_index] = 0
+    active_points[0] = 0
+    n_points = 1
+    n_active = 1
 
-def poisson_disc_sampling(radius: float, sample_domain_size: Shape, sample_rejection_threshold=30) -> ListOfPoints:
+    while n_active > 0:
+        random_index = np.random.randint(0, n_active)
+        random_sample = points[active_points[random_index]]
+
+        found = False
+        for _ in range(sample_rejection_threshold):
+            _get_random_annulus_candidate(random_sample, radius, candidate)
+            if _is_sample_valid(candidate, sample_domain_size, grid, grid_shape, grid_strides, cell_size,
+                                cell_reach, radius_sq, points, cell_index, neighbour_index):
+                # Double the preallocated buffers when full
+                if n_points == points.shape[0]:
+                    grown_points = np.empty((2 * n_points, dimension), dtype=np.float64)
+                    grown_points[:n_points] = points
+                    points = grown_points
+                    grown_active_points = np.empty(2 * n_points, dtype=np.int64)
+                    grown_active_points[:n_active] = active_points[:n_active]
+                    active_points = grown_active_points
+                points[n_points] = candidate
+                flat_index = 0
+                for i in range(dimension):
+                    flat_index += cell_index[i] * grid_strides[i]
+                grid[flat_index] = n_points
+                active_points[n_active] = n_points
+                n_points += 1
+                n_active += 1
+                found = True
+                break
+
+        if not found:
+            # Swap-remove the exhausted sample from the active list
+            n_active -= 1
+            active_points[random_index] = active_points[n_active]
+
+    # Offsetting by origin also copies the points out of the oversized buffer
+    return points[:n_points] + origin
+
+
+def poisson_disc_sampling(radius: float, sample_domain_size: Shape, sample_rejection_threshold=30, seed=None,
+                          origin=None, cell_size=None) -> ArrayOfPoints:
     """
-    Returns a list of random points from the sampling domain such that the distance between any two points
+    Returns an array of random points from the sampling domain such that the distance between any two points
     is at least the radius. The sampling is done using Bridson algorithm. This implementation supports sampling
     in n-dimensional spaces.
 
@@ -72,46 +196,61 @@ def poisson_disc_sampling(radius: float, sample_domain_size: Shape, sample_rejec
             The number which defines how much samples from the neighbourhood of a given point is tested.
             Default is 30.
 
+        seed : int, optional
+            Seed of the random generator used by the sampling, the current random state is used if None.
+            Default is None.
+
+        origin : ndarray, optional
+            Position of the domain corner, the points are returned in [origin, origin + sample_domain_size].
+            Default is None, which is the zero vector.
+
+        cell_size : float, optional
+            The precomputed side of the background grid cells, must not exceed radius/sqrt(dimension).
+            Default is None, which is radius/sqrt(dimension).
+
         Returns
         -------
-        points : List[ndarray]
-            A list of samples (points).
+        points : ndarray
+            An (n, dimension) array of samples (points), n is always >= 1.
 
         Notes
         -----
+        A background grid with cell size radius/sqrt(dimension) stores at most one point per cell, so each
+        candidate is only tested against the points of its neighbouring cells and the sampling runs in
+        linear time in the number of points. The sampling loop is compiled with numba when it is installed.
         If the sample_rejection_threshold parameter is too low, the points may not be distributed evenly.
         There may be even some large free spaces. The default is set to be 30 - it value recommended
         by the algorithm's author - Robert Bridson. More information in the paper linked below.
         https://www.cs.ubc.ca/~rbridson/docs/bridson-siggraph07-poissondisk.pdf
            """
-    dimension = sample_domain_size.shape[0]
-
-    cell_size: float = radius / np.sqrt(dimension)
-    grid_shape = np.ceil(sample_domain_size / cell_size).astype(int)
-
-    # contains indexes of points in the 'points' list
-    grid = np.full(shape=grid_shape, fill_value=-1)
-    points: ListOfPoints = []
-    active_points: ListOfPoints = []
-
-    initial_sample = np.random.rand(dimension) * sample_domain_size / 2
-    active_points.append(initial_sample)
-
-    while len(active_points) > 0:
-        random_index = np.random.choice(len(active_points))
-        random_sample = active_points[random_index]
-
-        for _ in range(sample_rejection_threshold):
-            sample_candidate = random_sample + _get_random_n_dim_vector(dimension, radius, 2 * radius)
-            if _is_sample_valid(sample_candidate, sample_domain_size, grid, cell_size, radius, points):
-                points.append(sample_candidate)
-                active_points.append(sample_candidate)
-                candidate_grid_index = tuple(int(x) for x in (sample_candidate // cell_size))
-                grid[candidate_grid_index] = len(points) - 1
-                break
-        else:
-            active_points.pop(random_index)
-
-    return points
+    sample_domain_size = np.asarray(sample_domain_size, dtype=np.float64)
+    if sample_domain_size.ndim != 1 or sample_domain_size.shape[0] < 1:
+        raise ValueError(f"sample_domain_size must be a 1d array, got shape {sample_domain_size.shape}")
+    if np.any(sample_domain_size <= 0):
+        raise ValueError(f"sample_domain_size must be positive, got {sample_domain_size}")
+    if radius <= 0:
+        raise ValueError(f"radius must be positive, got {radius}")
+    if seed is not None and seed < 0:
+        raise ValueError(f"seed must be non-negative, got {seed}")
+    if origin is None:
+        origin = np.zeros_like(sample_domain_size)
+    origin = np.asarray(origin, dtype=np.float64)
+    if origin.shape != sample_domain_size.shape:
+        raise ValueError(f"origin must have shape {sample_domain_size.shape}, got {origin.shape}")
+    max_cell_size = radius / math.sqrt(sample_domain_size.shape[0])
+    if cell_size is None:
+        cell_size = max_cell_size
+    if not 0 < cell_size <= max_cell_size * (1 + 1e-9):
+        raise ValueError(f"cell_size must be in (0, radius/sqrt(dimension)] = (0, {max_cell_size}], got {cell_size}")
+    # Candidates are compared against squared distances, square the radius once per call
+    args = (float(radius), float(radius) ** 2, float(cell_size), sample_domain_size, int(sample_rejection_threshold))
 
+    if _NUMBA_AVAILABLE or seed is None:
+        return _bridson_core(*args, -1 if seed is None else int(seed), origin)
 
+    # Without numba the core seeds numpy's global random state, keep the seed local to this call
+    random_state = np.random.get_state()
+    try:
+        return _bridson_core(*args, int(seed), origin)
+    finally:
+        np.random.set_state(random_state)
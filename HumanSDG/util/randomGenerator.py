@@ -0,0 +1,48 @@
+from typing import Dict, Optional, Sequence
+import numpy as np
+
+# Append new names at the end, spawned streams are assigned by position
+RANDOMIZER_NAMES = ("foreground_object_placement",
+                    "light",
+                    "camera",
+                    "background_object_placement",
+                    "occluder_placement",
+                    "object_scale",
+                    "texture",
+                    "rotation",
+                    "human_rotation",
+                    "animation")
+
+
+def make_rngs(seed: Optional[int] = None,
+              scene_index: int = 0,
+              names: Sequence[str] = RANDOMIZER_NAMES) -> Dict[str, np.random.Generator]:
+    """
+    Returns one independent random generator per randomizer, all spawned from a single SeedSequence. Every
+    randomizer draws only from its generator (the poisson disk samplings are seeded from it too) and lists its
+    assets in sorted order, so a scene is regenerated from (seed, scene_index) given the same asset folders.
+
+        Parameters
+        ----------
+        seed : int, optional
+            The master seed of the dataset. If None, fresh entropy is drawn from the OS and scenes are not
+            reproducible. Default is None.
+
+        scene_index : int, optional
+            Index of the scene in the dataset, scenes generated with the same seed but another index get
+            different random streams. Default is 0.
+
+        names : Sequence[str], optional
+            Names of the randomizers which need a generator. Default is RANDOMIZER_NAMES.
+
+        Returns
+        -------
+        rngs : Dict[str, numpy.random.Generator]
+            A generator for each name.
+
+        References
+        ----------
+        https://numpy.org/doc/stable/reference/random/parallel.html#seedsequence-spawning
+    """
+    seed_sequence = np.random.SeedSequence(seed, spawn_key = (scene_index,))
+    return {name: np.random.default_rng(child) for name, child in zip(names, seed_sequence.spawn(len(names)))}
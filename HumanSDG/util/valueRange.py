@@ -0,0 +1,10 @@
+from typing import NamedTuple
+
+
+class Range(NamedTuple):
+    """
+    An immutable (min, max) pair describing the distribution of a randomized value. Fields are read by
+    attribute (r.min, r.max) or unpacked (lo, hi = r), and being a tuple it is hashable.
+    """
+    min: float
+    max: float